@@ -0,0 +1,91 @@
+"""
+PostgreSQL backend with an optional psycopg 3 connection pool.
+
+Django 4.2 has no pooling of its own. With ``OPTIONS["pool"]`` set (see
+``apps.core.dburl``), every alias gets one ``psycopg_pool.ConnectionPool``
+per process: opening a connection checks one out of the pool and closing
+it hands it back, so ``CONN_MAX_AGE`` must be 0. Without the option the
+backend behaves exactly like Django's.
+
+Either way the time spent obtaining a connection is recorded per alias and
+reported by ``apps.core.backends.stats.checkout_stats()``, together with
+the pool's own counters.
+"""
+
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+from ..stats import pools, pools_lock, stats_for
+
+
+class _PooledDriver:
+    """The driver module, with ``connect()`` checking out of ``pool``."""
+
+    def __init__(self, wrapper: "DatabaseWrapper"):
+        self._wrapper = wrapper
+
+    def connect(self, **conn_params):
+        return self._wrapper.get_pool(conn_params).getconn()
+
+    def __getattr__(self, name):
+        return getattr(base.Database, name)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, settings_dict, alias="default"):
+        super().__init__(settings_dict, alias)
+        self.pool_options = self.settings_dict["OPTIONS"].get("pool")
+        self.pool = None
+        if self.pool_options:
+            if not is_psycopg3:
+                raise ImproperlyConfigured("Connection pooling requires psycopg 3.")
+            if self.settings_dict["CONN_MAX_AGE"] != 0:
+                raise ImproperlyConfigured("Pooled databases must set CONN_MAX_AGE to 0.")
+            # The parent's get_new_connection() calls self.Database.connect().
+            self.Database = _PooledDriver(self)
+
+    def get_pool(self, conn_params: dict):
+        key = (self.alias, conn_params.get("dbname"))
+        with pools_lock:
+            pool = pools.get(key)
+            if pool is None:
+                from psycopg_pool import ConnectionPool
+
+                pool = ConnectionPool(
+                    kwargs=conn_params,
+                    min_size=self.pool_options["min_size"],
+                    max_size=self.pool_options["max_size"],
+                    timeout=self.pool_options["timeout"],
+                    check=ConnectionPool.check_connection,
+                    name=self.alias,
+                    open=True,
+                )
+                pools[key] = pool
+        self.pool = pool
+        return pool
+
+    def get_connection_params(self) -> dict:
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        stats = stats_for(self.alias)
+        started = time.perf_counter()
+        try:
+            connection = super().get_new_connection(conn_params)
+        except Exception:
+            stats.record(time.perf_counter() - started, failed=True)
+            raise
+        stats.record(time.perf_counter() - started)
+        return connection
+
+    def _close(self):
+        if self.pool is not None and self.connection is not None:
+            with self.wrap_database_errors:
+                # The pool rolls back or discards a connection left mid-transaction.
+                return self.pool.putconn(self.connection)
+        return super()._close()
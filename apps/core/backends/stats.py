@@ -0,0 +1,61 @@
+"""
+Connection checkout metrics of the project's database backends.
+
+Kept free of driver imports so that the stats view works whatever backend
+is configured.
+"""
+
+import threading
+
+# (alias, database name): the test runner renames the database of an alias.
+pools: dict[tuple[str, str], object] = {}
+pools_lock = threading.Lock()
+
+
+class CheckoutStats:
+    """Connection checkouts of one alias in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.errors = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.errors += failed
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "errors": self.errors,
+                "wait_seconds": self.wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+
+_stats: dict[str, CheckoutStats] = {}
+
+
+def stats_for(alias: str) -> CheckoutStats:
+    with pools_lock:
+        return _stats.setdefault(alias, CheckoutStats())
+
+
+def checkout_stats() -> dict[str, dict]:
+    """Per-alias checkout counters, plus ``pool`` sizes for pooled aliases."""
+    with pools_lock:
+        stats = {alias: entry.as_dict() for alias, entry in _stats.items()}
+        pooled = dict(pools)
+    for (alias, _), pool in pooled.items():
+        stats.setdefault(alias, CheckoutStats().as_dict())["pool"] = pool.get_stats()
+    return stats
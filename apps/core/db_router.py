@@ -0,0 +1,113 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+Safe requests to views using :class:`ReplicaReadMixin` read from a random
+alias in ``DATABASE_REPLICAS``; everything else, including every write,
+goes to ``default``. A user who has just written is pinned to the primary
+for ``REPLICA_STICKY_SECONDS``, held in the shared cache so the pin holds
+in every worker. On PostgreSQL the pin records the primary's WAL position
+and is released early once the chosen replica has replayed past it.
+"""
+
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+_read_alias: ContextVar[str | None] = ContextVar("read_alias", default=None)
+
+
+class ReplicaRouter:
+    """Send reads to the alias chosen for the current request, writes to ``default``."""
+
+    def db_for_read(self, model, **hints) -> str | None:
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints) -> str:
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db == "default"
+
+
+def _sticky_key(user_id) -> str:
+    return f"replica:sticky:{user_id}"
+
+
+def _wal_position(alias: str, function: str) -> str | None:
+    if connections[alias].vendor != "postgresql":
+        return None
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(f"SELECT {function}()::text")
+            return cursor.fetchone()[0]
+    except DatabaseError:
+        return None
+
+
+def _replayed(alias: str, position: str) -> bool:
+    """Whether replica ``alias`` has replayed the primary's WAL up to ``position``."""
+    if connections[alias].vendor != "postgresql":
+        return False
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT pg_last_wal_replay_lsn() >= %s::pg_lsn", [position])
+            return bool(cursor.fetchone()[0])
+    except DatabaseError:
+        return False
+
+
+def mark_sticky(user_id) -> None:
+    """Pin ``user_id``'s reads to the primary after a write."""
+    if not settings.DATABASE_REPLICAS:
+        return
+    position = _wal_position("default", "pg_current_wal_lsn") or ""
+    cache.set(_sticky_key(user_id), position, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def choose_read_alias(user) -> str | None:
+    """A replica for ``user``'s reads, or None for the primary."""
+    if not settings.DATABASE_REPLICAS:
+        return None
+    alias = random.choice(settings.DATABASE_REPLICAS)
+    if user is not None and user.is_authenticated:
+        position = cache.get(_sticky_key(user.pk))
+        if position is not None and not (position and _replayed(alias, position)):
+            return None
+    return alias
+
+
+class ReplicaReadMixin:
+    """
+    Route a view's safe requests to a replica; mark the user sticky after
+    a successful write. Authentication still reads from the primary, since
+    the alias is chosen only once ``initial()`` has identified the user.
+    """
+
+    _read_alias_token = None
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS:
+            self._read_alias_token = _read_alias.set(choose_read_alias(request.user))
+
+    def finalize_response(self, request: Request, response: Response, *args, **kwargs):
+        if self._read_alias_token is not None:
+            _read_alias.reset(self._read_alias_token)
+            self._read_alias_token = None
+        if (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            mark_sticky(request.user.pk)
+        return super().finalize_response(request, response, *args, **kwargs)
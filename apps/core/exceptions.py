@@ -94,6 +94,8 @@ def _get_error_code(status_code: int) -> str:
         404: "NOT_FOUND",
         405: "METHOD_NOT_ALLOWED",
         409: "CONFLICT",
+        415: "UNSUPPORTED_MEDIA_TYPE",
+        429: "TOO_MANY_REQUESTS",
         500: "INTERNAL_SERVER_ERROR",
     }
     return codes.get(status_code, "ERROR")
@@ -0,0 +1,107 @@
+"""
+Logging that never makes a request wait on its output.
+
+``QueueingHandler`` only puts records on a bounded in-memory queue; a
+background ``QueueListener`` thread formats them and writes them to the
+stream. When the queue is full (the stream cannot keep up) records are
+dropped and counted rather than blocking the request.
+
+``JSONFormatter`` renders one JSON object per line, including any of
+``REQUEST_FIELDS`` passed through ``extra``.
+"""
+
+import copy
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+REQUEST_FIELDS = ("request_id", "method", "path", "route", "status", "duration_ms", "user_id")
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in REQUEST_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class QueueingHandler(QueueHandler):
+    """
+    Hand records to a listener thread that writes them to ``stream``.
+
+    The listener is started lazily in each process, since threads do not
+    survive a gunicorn fork; ``logging.shutdown()`` drains it at exit.
+    """
+
+    def __init__(self, stream=None, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize))
+        self.target = logging.StreamHandler(stream or sys.stderr)
+        self.dropped = 0
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def setFormatter(self, fmt: logging.Formatter) -> None:
+        # Formatting happens on the listener thread.
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now, while its arguments still hold the values
+        # they had when logged; the JSON rendering is left to the listener.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = (self.target.formatter or logging.Formatter()).formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self.queue = queue.Queue(self.queue.maxsize)
+            self._listener = QueueListener(self.queue, self.target, respect_handler_level=True)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._pid == os.getpid():
+            self.queue.join()
+        self.target.flush()
+
+    def close(self) -> None:
+        if self._pid == os.getpid():
+            self._listener.stop()
+            self._pid = None
+        self.target.close()
+        super().close()
@@ -1,25 +1,92 @@
 import logging
+import random
+import re
 import time
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+REQUEST_ID_HEADER = "X-Request-ID"
+VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
 
 class RequestLoggingMiddleware:
-    """Logs incoming requests with method, path, status code and duration."""
+    """
+    Logs one structured record per request: request id, method, path, route
+    template, status code, duration and user id (see ``apps.core.log``).
+
+    Responses below 400 are sampled at ``REQUEST_LOG_SAMPLE_RATE``; client
+    and server errors are always logged. The request id is taken from an
+    incoming ``X-Request-ID`` header when valid, generated otherwise, and
+    echoed on the response.
+
+    Sync and async capable, so async views are not forced through a thread
+    when the project is served over ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
 
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         start_time = time.monotonic()
+        request.request_id = self.get_request_id(request)
         response = self.get_response(request)
-        duration_ms = (time.monotonic() - start_time) * 1000
+        self.log(request, response, start_time)
+        return response
 
-        logger.info(
+    async def __acall__(self, request):
+        start_time = time.monotonic()
+        request.request_id = self.get_request_id(request)
+        response = await self.get_response(request)
+        self.log(request, response, start_time)
+        return response
+
+    @staticmethod
+    def get_request_id(request) -> str:
+        request_id = request.headers.get(REQUEST_ID_HEADER, "")
+        if VALID_REQUEST_ID.fullmatch(request_id):
+            return request_id
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def log(request, response, start_time: float) -> None:
+        response[REQUEST_ID_HEADER] = request.request_id
+        status_code = response.status_code
+        if status_code < 400 and random.random() >= settings.REQUEST_LOG_SAMPLE_RATE:
+            return
+
+        duration_ms = (time.monotonic() - start_time) * 1000
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        match = request.resolver_match
+        logger.log(
+            level,
             "%s %s %s %.0fms",
             request.method,
             request.get_full_path(),
-            response.status_code,
+            status_code,
             duration_ms,
+            extra={
+                "request_id": request.request_id,
+                "method": request.method,
+                "path": request.path,
+                "route": match.route if match else None,
+                "status": status_code,
+                "duration_ms": round(duration_ms, 2),
+                "user_id": getattr(getattr(request, "user", None), "pk", None),
+            },
         )
-        return response
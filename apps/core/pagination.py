@@ -1,9 +1,258 @@
-from rest_framework.pagination import PageNumberPagination
+import asyncio
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cached_property, partial
+
+from django.core.paginator import EmptyPage, InvalidPage, Page
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination over the queryset's own ordering.
+
+    The ordering produced by the filter backends (e.g. ``-created_at`` or
+    ``price``) is extended with ``pk`` as a tie-breaker, and the cursor
+    stores the last row's values for those fields. Each page is a single
+    ``WHERE (...) > cursor ORDER BY ... LIMIT n`` query; no COUNT is issued.
+    """
+
+    page_size = 10
+    page_size_query_param = "per_page"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        """Async ORM variant of :meth:`paginate_queryset`."""
+        return self.set_page([row async for row in self.get_page_queryset(queryset, request)])
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> QuerySet:
+        """Order, position after the cursor and slice one extra row to detect a next page."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request, self.ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(self.ordering, position))
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, rows: list) -> list:
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        self.next_position = (
+            [self._value(rows[-1], field) for field in self.ordering] if self.has_next else None
+        )
+        return rows
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset: QuerySet) -> list:
+        """Return the queryset ordering as field names, ending with a pk tie-breaker."""
+        ordering = list(queryset.query.order_by)
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+        if not all(isinstance(field, str) for field in ordering):
+            raise TypeError("KeysetPagination only supports ordering by field names.")
+
+        pk_names = {"pk", queryset.model._meta.pk.name}
+        if not any(field.lstrip("-") in pk_names for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+        return ordering
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor())
+
+    def encode_cursor(self) -> str:
+        payload = {"o": self.ordering, "p": [_to_json(v) for v in self.next_position]}
+        raw = json.dumps(payload, separators=(",", ":")).encode("ascii")
+        return urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request: Request, ordering: list) -> list | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            payload = json.loads(raw)
+            position = payload["p"]
+            valid = payload["o"] == ordering and len(position) == len(ordering)
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            valid = False
+        if not valid:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    @staticmethod
+    def _value(row, field: str):
+        name = field.lstrip("-")
+        if isinstance(row, dict):
+            return row["id" if name == "pk" else name]
+        return getattr(row, name)
+
+    @staticmethod
+    def _after(ordering: list, position: list) -> Q:
+        """
+        Build ``(f1, f2, ...) > (v1, v2, ...)`` honouring each field's direction:
+        ``f1 > v1 OR (f1 = v1 AND (f2 > v2 OR (f2 = v2 AND ...)))``.
+        """
+        condition = None
+        for field, value in reversed(list(zip(ordering, position))):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            beyond = Q(**{f"{name}__{lookup}": value})
+            if condition is None:
+                condition = beyond
+            else:
+                condition = beyond | (Q(**{name: value}) & condition)
+        return condition
+
+
+class CountedPaginator(DjangoPaginator):
+    """Django paginator that trusts a precomputed total instead of running COUNT(*)."""
+
+    def __init__(self, *args, count: int = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.known_count = count
+
+    @cached_property
+    def count(self) -> int:
+        if self.known_count is not None:
+            return self.known_count
+        return super().count
 
 
 class StandardPagination(PageNumberPagination):
-    """Project-wide pagination with configurable page size."""
+    """
+    Project-wide pagination with configurable page size.
+
+    Requests carrying a ``cursor`` query parameter (an empty value starts
+    from the first page) switch to :class:`KeysetPagination`, which never
+    counts rows and keeps deep pages as cheap as the first one.
+
+    Views may define ``get_pagination_count()`` returning a known total (or
+    None) to spare the page-number mode its COUNT query.
+    """
 
     page_size = 10
     page_size_query_param = "per_page"
     max_page_size = 100
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None):
+        self.keyset = None
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        count = None
+        if hasattr(view, "get_pagination_count"):
+            count = view.get_pagination_count()
+        self.django_paginator_class = partial(CountedPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        """
+        Async ORM variant of :meth:`paginate_queryset`.
+
+        In page-number mode the total (``view.aget_pagination_count()`` or
+        COUNT) and the page rows are fetched concurrently; the page number is
+        validated against the total once both are in.
+        """
+        self.keyset = None
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return await self.keyset.apaginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        page_number = request.query_params.get(self.page_query_param) or 1
+        paginator = CountedPaginator(queryset, page_size)
+
+        async def count() -> int:
+            known = None
+            if hasattr(view, "aget_pagination_count"):
+                known = await view.aget_pagination_count()
+            return known if known is not None else await queryset.acount()
+
+        async def fetch(number: int) -> list:
+            offset = (number - 1) * page_size
+            return [row async for row in queryset[offset : offset + page_size]]
+
+        last = page_number in self.last_page_strings
+        try:
+            number = 1 if last else int(page_number)
+        except ValueError:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message="That page number is not an integer"
+                )
+            )
+
+        try:
+            if last:
+                paginator.known_count = await count()
+                number = paginator.num_pages
+                rows = await fetch(number)
+            elif number < 1:
+                raise EmptyPage("That page number is less than 1")
+            else:
+                paginator.known_count, rows = await asyncio.gather(count(), fetch(number))
+            paginator.validate_number(number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            )
+        self.page = Page(rows, number, paginator)
+        return rows
+
+    def get_paginated_response(self, data) -> Response:
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+def _to_json(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
@@ -0,0 +1,128 @@
+import csv
+import io
+from collections.abc import Iterable, Iterator, Sequence
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+# DRF's encoder fallback (datetimes, Decimal, lazy strings, querysets, ...),
+# shared by the orjson and MessagePack paths so every format agrees with
+# what the stock JSONRenderer would have produced.
+encoder_default = encoders.JSONEncoder().default
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_dumps(data) -> bytes:
+    return orjson.dumps(data, default=encoder_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer backed by orjson.
+
+    Output matches the stock renderer for compact responses (datetimes and
+    Decimals go through DRF's encoder); indented output, e.g. for the
+    browsable API, is left to the stdlib implementation.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson_dumps(data)
+        # Keep the stock renderer's JavaScript-safe escaping of U+2028/U+2029.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack for service-to-service clients (``Accept: application/msgpack``)."""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encoder_default, use_bin_type=True)
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Base for line-oriented export formats.
+
+    ``render()`` handles ordinary response data (e.g. error envelopes), while
+    ``stream()`` turns an iterator of row tuples into an iterator of byte
+    chunks for a ``StreamingHttpResponse`` without materializing the rows.
+    """
+
+    charset = "utf-8"
+    rows_per_chunk = 500
+
+    def stream(self, columns: Sequence[str], rows: Iterable[Sequence]) -> Iterator[bytes]:
+        header = self.render_header(columns)
+        if header:
+            yield header
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.rows_per_chunk:
+                yield self.render_rows(columns, chunk)
+                chunk = []
+        if chunk:
+            yield self.render_rows(columns, chunk)
+
+    def render_header(self, columns: Sequence[str]) -> bytes:
+        return b""
+
+    def render_rows(self, columns: Sequence[str], rows: list) -> bytes:
+        raise NotImplementedError
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """Newline-delimited JSON: one object per line."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        return self._dumps(data) + b"\n"
+
+    def render_rows(self, columns: Sequence[str], rows: list) -> bytes:
+        return b"".join(self._dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+    @staticmethod
+    def _dumps(data) -> bytes:
+        return orjson_dumps(data)
+
+
+class CSVRenderer(StreamingRenderer):
+    """Comma-separated values with a header row."""
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        columns = list(rows[0]) if rows and isinstance(rows[0], dict) else []
+        values = [[row.get(column) for column in columns] for row in rows]
+        return self.render_header(columns) + self.render_rows(columns, values)
+
+    def render_header(self, columns: Sequence[str]) -> bytes:
+        return self.render_rows(columns, [columns])
+
+    def render_rows(self, columns: Sequence[str], rows: list) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,150 @@
+"""
+Two-tier cache of rendered GET responses, invalidated by per-owner versions.
+
+Every key embeds the owner's current version number, held in the shared
+Django cache; a write bumps that number (``ResponseCache.bump``) and every
+cached response of the owner becomes unreachable at once, with no key scans.
+Entries are looked up in a per-process LRU (:class:`apps.core.cache.TTLCache`)
+first, then in the shared backend, and are revalidated against
+``If-None-Match``/``If-Modified-Since`` without running the view.
+"""
+
+import hashlib
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from .cache import TTLCache
+
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Vary")
+
+
+class ResponseCache:
+    """Per-owner versioned cache of rendered responses; see the module docstring."""
+
+    def __init__(self, namespace: str, alias: str, ttl: int, local_size: int, local_ttl: int):
+        self.namespace = namespace
+        self.alias = alias
+        self.ttl = ttl
+        self.local = TTLCache(local_size, local_ttl)
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def _version_key(self, owner_id) -> str:
+        return f"{self.namespace}:version:{owner_id}"
+
+    def version(self, owner_id) -> int:
+        # Versions start from the clock, so one evicted from the shared backend
+        # never comes back with a number that old entries were stored under.
+        return self.shared.get_or_set(self._version_key(owner_id), time.time_ns, timeout=None)
+
+    def bump(self, owner_id) -> None:
+        """Invalidate every cached response of ``owner_id``."""
+        key = self._version_key(owner_id)
+        if self.shared.add(key, time.time_ns(), timeout=None):
+            return
+        try:
+            self.shared.incr(key)
+        except ValueError:
+            self.shared.set(key, time.time_ns(), timeout=None)
+
+    def key(self, request: HttpRequest, owner_id, media_type: str) -> str:
+        """Owner, version, host, path, sorted query string and negotiated media type."""
+        query = urlencode(sorted(request.GET.lists()), doseq=True)
+        raw = "|".join(
+            [str(self.version(owner_id)), request.get_host(), request.path, query, media_type]
+        )
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        return f"{self.namespace}:response:{owner_id}:{digest}"
+
+    def get(self, key: str) -> tuple[bytes, dict] | None:
+        entry = self.local.get(key)
+        if entry is not None:
+            self._count("local_hits")
+            return entry
+        entry = self.shared.get(key)
+        if entry is not None:
+            self._count("shared_hits")
+            self.local.set(key, entry)
+            return entry
+        self._count("misses")
+        return None
+
+    def set(self, key: str, response: HttpResponse) -> None:
+        headers = {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+        entry = (response.content, headers)
+        self.local.set(key, entry)
+        self.shared.set(key, entry, timeout=self.ttl)
+
+    def stats(self) -> dict:
+        """Hit and miss counters of this process."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = sum(stats.values())
+        hits = stats.get("local_hits", 0) + stats.get("shared_hits", 0)
+        return {
+            "local_hits": stats.get("local_hits", 0),
+            "shared_hits": stats.get("shared_hits", 0),
+            "misses": stats.get("misses", 0),
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    def reset(self) -> None:
+        self.local.clear()
+        with self._stats_lock:
+            self._stats.clear()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def cache_per_owner(self, view):
+        """
+        Cache successful GETs of a DRF view method for the authenticated user.
+
+        Apply outside ``condition()`` so that hits skip its change-marker
+        query too. ``X-Cache`` reports HIT or MISS.
+        """
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != "GET" or not request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+
+            key = self.key(request, request.user.pk, request.accepted_media_type or "")
+            entry = self.get(key)
+            if entry is not None:
+                return self._replay(request, *entry)
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                response["X-Cache"] = "MISS"
+                if hasattr(response, "add_post_render_callback"):
+                    response.add_post_render_callback(lambda rendered: self.set(key, rendered))
+                else:
+                    self.set(key, response)
+            return response
+
+        return wrapper
+
+    @staticmethod
+    def _replay(request, content: bytes, headers: dict) -> HttpResponse:
+        response = HttpResponse(content)
+        for name, value in headers.items():
+            response[name] = value
+        response["X-Cache"] = "HIT"
+        last_modified = parse_http_date_safe(headers.get("Last-Modified", ""))
+        return get_conditional_response(
+            request, etag=headers.get("ETag"), last_modified=last_modified, response=response
+        )
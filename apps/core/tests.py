@@ -1,3 +1,476 @@
-from django.test import TestCase
+import io
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from decimal import Decimal
 
-# Create your tests here.
+import msgpack
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse, reverse_lazy
+from rest_framework import status
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+
+from apps.core import db_router
+from apps.core.backends import stats as db_stats
+from apps.core.dburl import parse_database_url
+from apps.core.log import JSONFormatter, QueueingHandler
+from apps.core.parsers import MessagePackParser, ORJSONParser
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer
+from apps.core.throttling import (
+    LoginRateThrottle,
+    ReadRateThrottle,
+    SharedBucketStore,
+)
+from apps.items.models import Item
+from apps.users.models import User
+
+MSGPACK = "application/msgpack"
+
+
+@pytest.fixture
+def payload():
+    return {
+        "success": False,
+        "error": "VALIDATION_ERROR",
+        "message": "Ünïcode   line separator",
+        "details": {"price": [ErrorDetail("Bad price.", code="invalid")]},
+        "created_at": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "amount": Decimal("19.99"),
+        "counts": {1: 2},
+    }
+
+
+# ─── Renderer Tests ────────────────────────────────
+
+
+class TestORJSONRenderer:
+    def test_matches_stock_renderer(self, payload):
+        assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_indented_output_falls_back_to_stock_renderer(self, payload):
+        context = {"indent": 4}
+
+        rendered = ORJSONRenderer().render(payload, renderer_context=context)
+
+        assert rendered == JSONRenderer().render(payload, renderer_context=context)
+
+    def test_none_renders_empty(self):
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestMessagePackRenderer:
+    def test_same_values_as_json(self, payload):
+        unpacked = msgpack.unpackb(MessagePackRenderer().render(payload), strict_map_key=False)
+
+        # MessagePack keeps non-string map keys; everything else matches JSON.
+        expected = json.loads(JSONRenderer().render(payload))
+        assert unpacked == {**expected, "counts": {1: 2}}
+
+
+# ─── Parser Tests ──────────────────────────────────
+
+
+class TestParsers:
+    def test_orjson_parser(self):
+        assert ORJSONParser().parse(io.BytesIO(b'{"price": 1.5, "name": "x"}')) == {
+            "price": 1.5,
+            "name": "x",
+        }
+
+    @pytest.mark.parametrize("body", [b"{invalid", b'{"price": NaN}'])
+    def test_orjson_parser_rejects_invalid(self, body):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(body))
+
+    def test_msgpack_parser(self):
+        body = msgpack.packb({"name": "x", "price": "1.50"})
+
+        assert MessagePackParser().parse(io.BytesIO(body)) == {"name": "x", "price": "1.50"}
+
+    def test_msgpack_parser_rejects_invalid(self):
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b"\xc1"))
+
+
+# ─── Content Negotiation Tests ─────────────────────
+
+
+@pytest.mark.django_db
+class TestContentNegotiation:
+    def test_msgpack_list_matches_json(self, auth_client, user):
+        Item.objects.create(name="Phone", category="electronics", price="999.90", owner=user)
+        url = reverse("items:item-list")
+
+        as_json = auth_client.get(url)
+        as_msgpack = auth_client.get(url, HTTP_ACCEPT=MSGPACK)
+
+        assert as_msgpack["Content-Type"] == MSGPACK
+        assert msgpack.unpackb(as_msgpack.content) == json.loads(as_json.content)
+
+    def test_error_envelope_identical_across_formats(self, auth_client):
+        url = reverse("items:item-detail", kwargs={"pk": 999999})
+
+        as_json = auth_client.get(url)
+        as_msgpack = auth_client.get(url, HTTP_ACCEPT=MSGPACK)
+
+        assert as_msgpack.status_code == as_json.status_code == status.HTTP_404_NOT_FOUND
+        envelope = msgpack.unpackb(as_msgpack.content)
+        assert envelope == json.loads(as_json.content)
+        assert envelope["success"] is False
+
+    def test_msgpack_request_body(self, auth_client):
+        payload = {"name": "Packed", "category": "books", "price": "12.50"}
+
+        response = auth_client.post(reverse("items:item-list"), payload, format="msgpack")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Item.objects.get().name == "Packed"
+
+    def test_malformed_json_body(self, auth_client):
+        response = auth_client.post(
+            reverse("items:item-list"), b"{broken", content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["success"] is False
+
+
+# ─── Throttling Tests ──────────────────────────────
+
+
+class TestSharedBucketStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return SharedBucketStore(str(tmp_path / "buckets"), slots=64)
+
+    def test_bucket_allows_burst_then_waits(self, store):
+        waits = [store.consume("k", capacity=3, rate=1) for _ in range(4)]
+
+        assert waits[:3] == [0, 0, 0]
+        assert 0 < waits[3] <= 1
+
+    def test_bucket_refills(self, store, monkeypatch):
+        clock = iter([100.0, 100.0, 102.5])
+        monkeypatch.setattr("apps.core.throttling.time.time", lambda: next(clock))
+
+        store.consume("k", capacity=2, rate=1)
+        store.consume("k", capacity=2, rate=1)
+
+        assert store.consume("k", capacity=2, rate=1) == 0
+
+    def test_keys_are_independent(self, store):
+        store.consume("a", capacity=1, rate=1)
+
+        assert store.consume("b", capacity=1, rate=1) == 0
+
+    def test_store_is_shared_through_the_file(self, store):
+        store.consume("k", capacity=1, rate=0.1)
+        other = SharedBucketStore(store.path, slots=store.slots)
+
+        assert other.consume("k", capacity=1, rate=0.1) > 0
+
+
+@pytest.mark.django_db
+class TestThrottling:
+    def test_login_throttled_per_ip(self, api_client, monkeypatch):
+        monkeypatch.setattr(LoginRateThrottle, "get_rate", lambda self: "2/min")
+        url = reverse("users:login")
+        payload = {"email": "ghost@example.com", "password": "whatever"}
+
+        codes = [api_client.post(url, payload).status_code for _ in range(3)]
+        other_ip = api_client.post(url, payload, REMOTE_ADDR="10.0.0.2")
+
+        assert codes == [401, 401, 429]
+        assert other_ip.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_throttled_response_has_retry_after(self, auth_client, monkeypatch):
+        monkeypatch.setattr(ReadRateThrottle, "get_rate", lambda self: "1/min")
+        url = reverse("items:item-list")
+
+        auth_client.get(url)
+        response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json()["error"] == "TOO_MANY_REQUESTS"
+        assert 0 < int(response["Retry-After"]) <= 60
+
+    def test_reads_do_not_spend_write_tokens(self, auth_client, monkeypatch):
+        monkeypatch.setattr(ReadRateThrottle, "get_rate", lambda self: "1/min")
+        url = reverse("items:item-list")
+        auth_client.get(url)
+
+        response = auth_client.post(url, {"name": "X", "category": "books", "price": "1"})
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_async_views_are_throttled(self, auth_client, monkeypatch):
+        monkeypatch.setattr(ReadRateThrottle, "get_rate", lambda self: "1/min")
+        url = reverse("async_items:item-list")
+
+        auth_client.get(url)
+        response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
+
+
+# ─── Replica Routing Tests ─────────────────────────
+
+
+@pytest.mark.django_db
+class TestReplicaRouting:
+    @pytest.fixture
+    def replicas(self, settings):
+        settings.DATABASE_REPLICAS = ["replica1"]
+        settings.REPLICA_STICKY_SECONDS = 5
+
+    @pytest.fixture
+    def chosen(self, monkeypatch):
+        """Aliases picked for each safe request; queries still run on default."""
+        chosen = []
+        choose = db_router.choose_read_alias
+
+        def spy(user):
+            chosen.append(choose(user))
+            return None
+
+        monkeypatch.setattr(db_router, "choose_read_alias", spy)
+        return chosen
+
+    def test_router_follows_request_alias(self):
+        router = db_router.ReplicaRouter()
+        token = db_router._read_alias.set("replica1")
+        try:
+            assert router.db_for_read(Item) == "replica1"
+            assert router.db_for_write(Item) == "default"
+        finally:
+            db_router._read_alias.reset(token)
+
+        assert router.db_for_read(Item) is None
+        assert router.allow_migrate("replica1", "items") is False
+
+    def test_no_replicas_reads_primary(self, user, settings):
+        settings.DATABASE_REPLICAS = []
+
+        assert db_router.choose_read_alias(user) is None
+
+    def test_reads_go_to_replica(self, replicas, auth_client, chosen):
+        auth_client.get(reverse("items:item-list"))
+        auth_client.get(reverse("users:profile"))
+
+        assert chosen == ["replica1", "replica1"]
+
+    def test_reads_stick_to_primary_after_write(self, replicas, auth_client, chosen):
+        auth_client.post(
+            reverse("items:item-list"), {"name": "X", "category": "books", "price": "1"}
+        )
+        auth_client.get(reverse("items:item-list"))
+
+        assert chosen == [None]
+
+    def test_failed_write_is_not_sticky(self, replicas, auth_client, chosen):
+        auth_client.post(reverse("items:item-list"), {"name": ""})
+        auth_client.get(reverse("items:item-list"))
+
+        assert chosen == ["replica1"]
+
+    def test_stickiness_expires(self, replicas, user):
+        db_router.mark_sticky(user.pk)
+        assert db_router.choose_read_alias(user) is None
+
+        cache.delete(db_router._sticky_key(user.pk))
+        assert db_router.choose_read_alias(user) == "replica1"
+
+    def test_writes_are_not_routed(self, replicas, auth_client, chosen):
+        auth_client.patch(reverse("users:profile"), {"first_name": "Ada"})
+
+        assert chosen == []
+
+
+# ─── Database URL & Pool Stats Tests ───────────────
+
+
+class TestDatabaseUrl:
+    def test_defaults_to_persistent_connections(self):
+        entry = parse_database_url("postgres://app:s%40cret@db:5432/case_db")
+
+        assert entry["ENGINE"] == "apps.core.backends.postgresql"
+        assert (entry["NAME"], entry["USER"], entry["PASSWORD"]) == ("case_db", "app", "s@cret")
+        assert entry["CONN_MAX_AGE"] == 60
+        assert entry["CONN_HEALTH_CHECKS"] is True
+        assert entry["OPTIONS"] == {}
+
+    def test_pool_options(self):
+        entry = parse_database_url(
+            "postgres://app@db/case_db?pool=true&pool_min_size=4&pool_max_size=16&pool_timeout=2.5"
+        )
+
+        assert entry["OPTIONS"]["pool"] == {"min_size": 4, "max_size": 16, "timeout": 2.5}
+        assert entry["CONN_MAX_AGE"] == 0
+        assert entry["CONN_HEALTH_CHECKS"] is False
+
+    def test_timeouts_and_libpq_options(self):
+        entry = parse_database_url(
+            "postgres://app@db/case_db?connect_timeout=3&statement_timeout=5000&sslmode=require"
+        )
+
+        assert entry["OPTIONS"] == {
+            "connect_timeout": "3",
+            "options": "-c statement_timeout=5000",
+            "sslmode": "require",
+        }
+
+    def test_pgbouncer_bypasses_pooling(self):
+        entry = parse_database_url("postgres://app@bouncer:6432/case_db?pgbouncer=true&pool=true")
+
+        assert "pool" not in entry["OPTIONS"]
+        assert entry["CONN_MAX_AGE"] == 0
+        assert entry["DISABLE_SERVER_SIDE_CURSORS"] is True
+
+    def test_unlimited_conn_max_age(self):
+        assert parse_database_url("postgres://db/x?conn_max_age=none")["CONN_MAX_AGE"] is None
+
+    def test_sqlite(self):
+        assert parse_database_url("sqlite:////tmp/replica.sqlite3") == {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": "/tmp/replica.sqlite3",
+        }
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ImproperlyConfigured):
+            parse_database_url("postgres://db/x?pool=1&pool_min_size=5&pool_max_size=2")
+
+    def test_unsupported_scheme(self):
+        with pytest.raises(ImproperlyConfigured):
+            parse_database_url("mysql://db/x")
+
+
+@pytest.mark.django_db
+class TestDatabaseStats:
+    url = reverse_lazy("database-stats")
+
+    @pytest.fixture(autouse=True)
+    def isolated_stats(self, monkeypatch):
+        monkeypatch.setattr(db_stats, "_stats", {})
+
+    def test_checkouts_are_reported(self, api_client):
+        admin = User.objects.create_superuser(
+            email="admin@example.com", password="adminpass123", first_name="A", last_name="D"
+        )
+        api_client.force_authenticate(admin)
+        db_stats.stats_for("default").record(0.25)
+        db_stats.stats_for("default").record(0.05, failed=True)
+
+        data = api_client.get(self.url).json()["data"]
+
+        assert data["default"] == {
+            "checkouts": 2,
+            "errors": 1,
+            "wait_seconds": pytest.approx(0.3),
+            "max_wait_seconds": 0.25,
+        }
+
+    def test_requires_admin(self, auth_client):
+        assert auth_client.get(self.url).status_code == status.HTTP_403_FORBIDDEN
+
+
+# ─── Request Logging Tests ─────────────────────────
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def request_records():
+    handler = RecordingHandler()
+    middleware_logger = logging.getLogger("apps.core.middleware")
+    middleware_logger.addHandler(handler)
+    yield handler.records
+    middleware_logger.removeHandler(handler)
+
+
+@pytest.mark.django_db
+class TestRequestLogging:
+    def test_record_carries_request_context(self, auth_client, user, request_records):
+        response = auth_client.get(reverse("items:item-list"))
+
+        (record,) = request_records
+        assert record.request_id == response["X-Request-ID"]
+        assert record.route == "api/items/$"
+        assert record.user_id == user.pk
+        assert record.status == 200
+        assert record.duration_ms >= 0
+
+    def test_incoming_request_id_is_kept(self, auth_client, request_records):
+        response = auth_client.get(reverse("items:item-list"), HTTP_X_REQUEST_ID="edge-42")
+
+        assert response["X-Request-ID"] == "edge-42"
+        assert request_records[0].request_id == "edge-42"
+
+    def test_invalid_request_id_is_replaced(self, auth_client):
+        response = auth_client.get(reverse("items:item-list"), HTTP_X_REQUEST_ID="bad id\n")
+
+        assert len(response["X-Request-ID"]) == 32
+
+    def test_successes_are_sampled_errors_are_not(self, api_client, settings, request_records):
+        settings.REQUEST_LOG_SAMPLE_RATE = 0
+        api_client.get(reverse("schema"))
+        api_client.get(reverse("items:item-list"))
+
+        assert [record.status for record in request_records] == [401]
+        assert request_records[0].levelno == logging.WARNING
+
+
+class TestJSONFormatter:
+    def test_renders_extra_fields(self):
+        record = logging.makeLogRecord(
+            {"name": "apps.test", "levelno": logging.INFO, "levelname": "INFO",
+             "msg": "GET %s", "args": ("/x",), "request_id": "abc", "status": 200}
+        )
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["message"] == "GET /x"
+        assert entry["request_id"] == "abc"
+        assert entry["status"] == 200
+        assert "user_id" not in entry
+
+
+class TestQueueingHandler:
+    @pytest.fixture
+    def handler(self):
+        stream = io.StringIO()
+        handler = QueueingHandler(stream, maxsize=10)
+        handler.setFormatter(JSONFormatter())
+        yield handler
+        handler.close()
+
+    @staticmethod
+    def record(message: str, *args):
+        return logging.makeLogRecord({"msg": message, "args": args, "levelname": "INFO"})
+
+    def test_records_are_written_by_listener(self, handler):
+        handler.handle(self.record("hello %s", "world"))
+        handler.flush()
+
+        entry = json.loads(handler.target.stream.getvalue())
+        assert entry["message"] == "hello world"
+
+    def test_full_queue_drops_instead_of_blocking(self, handler, monkeypatch):
+        handler.handle(self.record("first"))
+        handler.flush()
+        monkeypatch.setattr(handler.queue, "put_nowait", lambda record: (_ for _ in ()).throw(queue.Full))
+
+        handler.handle(self.record("dropped"))
+
+        assert handler.dropped == 1
@@ -0,0 +1,150 @@
+"""
+Token-bucket throttles backed by a memory-mapped file.
+
+Every gunicorn worker on a host maps the same ``THROTTLE_STORE_PATH``, so a
+client's bucket is shared across workers without a cache server. Buckets
+live in a fixed table of slots addressed by a hash of the throttle key; a
+check is one byte-range lock and a 24-byte read/write, no query. Two keys
+landing in the same slot reset each other's bucket, which can only let a
+request through, never block one wrongly.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+# key fingerprint, tokens left, last update (epoch seconds)
+SLOT = struct.Struct("=Qdd")
+
+DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class SharedBucketStore:
+    """Fixed-size table of token buckets in a file mapped by every process."""
+
+    def __init__(self, path: str, slots: int):
+        self.path = path
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _open(self) -> None:
+        # Mappings and fcntl locks do not survive fork(); remap per process.
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = self.slots * SLOT.size
+        if os.fstat(fd).st_size < size:
+            os.ftruncate(fd, size)
+        self._fd = fd
+        self._mmap = mmap.mmap(fd, size)
+        self._pid = os.getpid()
+
+    def consume(self, key: str, capacity: float, rate: float) -> float:
+        """
+        Take one token from ``key``'s bucket.
+
+        Returns 0 when the request is allowed, otherwise the seconds until a
+        token is available. ``rate`` is the refill in tokens per second.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        fingerprint = int.from_bytes(digest, "little") | 1
+        offset = (fingerprint % self.slots) * SLOT.size
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._open()
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, SLOT.size, offset)
+            try:
+                now = time.time()
+                stored, tokens, updated = SLOT.unpack_from(self._mmap, offset)
+                if stored != fingerprint:
+                    tokens, updated = capacity, now
+                tokens = min(capacity, tokens + max(now - updated, 0) * rate)
+                if tokens >= 1:
+                    tokens, wait = tokens - 1, 0.0
+                else:
+                    wait = (1 - tokens) / rate
+                SLOT.pack_into(self._mmap, offset, fingerprint, tokens, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, SLOT.size, offset)
+        return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._open()
+            self._mmap[:] = bytes(len(self._mmap))
+
+
+buckets = SharedBucketStore(settings.THROTTLE_STORE_PATH, settings.THROTTLE_STORE_SLOTS)
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttle with a DRF-style ``scope`` whose rate (``"10/min"``) comes from
+    ``DEFAULT_THROTTLE_RATES``. The bucket holds that many tokens and refills
+    evenly over the period, so bursts up to the limit are allowed.
+
+    Authenticated requests are keyed by user, anonymous ones by client IP.
+    """
+
+    scope: str = None
+    methods: frozenset = None
+
+    def __init__(self):
+        self.num_requests, self.duration = self.parse_rate(self.get_rate())
+        self._wait = 0.0
+
+    def get_rate(self) -> str:
+        return api_settings.DEFAULT_THROTTLE_RATES[self.scope]
+
+    @staticmethod
+    def parse_rate(rate: str) -> tuple[int, int]:
+        num, period = rate.split("/")
+        return int(num), DURATIONS[period[0]]
+
+    def get_cache_key(self, request: Request, view) -> str:
+        if request.user and request.user.is_authenticated:
+            return f"{self.scope}:user:{request.user.pk}"
+        return f"{self.scope}:ip:{self.get_ident(request)}"
+
+    def allow_request(self, request: Request, view) -> bool:
+        if self.methods is not None and request.method not in self.methods:
+            return True
+        self._wait = buckets.consume(
+            self.get_cache_key(request, view),
+            capacity=self.num_requests,
+            rate=self.num_requests / self.duration,
+        )
+        return not self._wait
+
+    def wait(self) -> float:
+        return self._wait
+
+
+class ReadRateThrottle(TokenBucketThrottle):
+    scope = "reads"
+    methods = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class WriteRateThrottle(TokenBucketThrottle):
+    scope = "writes"
+    methods = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class LoginRateThrottle(TokenBucketThrottle):
+    """Per-IP bucket in front of the PBKDF2 check in ``LoginView``."""
+
+    scope = "login"
+
+
+class RegisterRateThrottle(TokenBucketThrottle):
+    scope = "register"
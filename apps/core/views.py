@@ -1,3 +1,15 @@
-from django.shortcuts import render
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from .backends.stats import checkout_stats
+
+
+class DatabaseStatsView(APIView):
+    """Connection checkout and pool counters of the worker serving the request."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        return Response({"success": True, "data": checkout_stats()})
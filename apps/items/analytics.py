@@ -0,0 +1,104 @@
+"""
+Single-pass item analytics.
+
+:func:`summarize` consumes ``(category, status, price)`` rows ordered by
+price — one indexed query — and derives the category × status matrix,
+per-category price statistics and a price histogram from that one stream.
+Prices are kept per category in compact ``array('d')`` buffers that arrive
+already sorted, so percentiles and histogram buckets need no extra sort.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+
+from .models import Item
+
+PERCENTILES = (25, 50, 75, 90, 95, 99)
+STATUSES = [value for value, _ in Item.STATUS_CHOICES]
+
+
+def percentile(values: array, pct: float) -> float:
+    """Linear-interpolated percentile of an ascending, non-empty sequence."""
+    position = (len(values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def histogram(groups: Iterable[array], buckets: int) -> list[dict]:
+    """Equal-width buckets over [min, max] of all sorted groups; the last bucket is closed."""
+    groups = [values for values in groups if values]
+    if not groups:
+        return []
+    low = min(values[0] for values in groups)
+    high = max(values[-1] for values in groups)
+    if low == high:
+        return [{"lower": low, "upper": high, "count": sum(len(v) for v in groups)}]
+
+    width = (high - low) / buckets
+    edges = [low + width * i for i in range(buckets)] + [high]
+    result = []
+    for i in range(buckets):
+        last = i == buckets - 1
+        count = 0
+        for values in groups:
+            start = bisect_left(values, edges[i])
+            end = bisect_right(values, edges[i + 1]) if last else bisect_left(values, edges[i + 1])
+            count += end - start
+        result.append({"lower": edges[i], "upper": edges[i + 1], "count": count})
+    return result
+
+
+class SummaryBuilder:
+    """Accumulates price-ordered rows; lets sync and async callers share one pass."""
+
+    def __init__(self):
+        self.matrix = defaultdict(Counter)
+        self.prices = defaultdict(lambda: array("d"))
+        self.sums = defaultdict(Decimal)
+
+    def add(self, category: str, status: str, price: Decimal) -> None:
+        self.matrix[category][status] += 1
+        self.prices[category].append(float(price))
+        self.sums[category] += price
+
+    def result(self, buckets: int = 10) -> dict:
+        prices = self.prices
+        categories = sorted(prices, key=lambda c: (-len(prices[c]), c))
+        price_stats = []
+        for category in categories:
+            values = prices[category]
+            stats = {
+                "category": category,
+                "count": len(values),
+                "min": values[0],
+                "max": values[-1],
+                "avg": float(self.sums[category] / len(values)),
+            }
+            stats.update({f"p{pct}": percentile(values, pct) for pct in PERCENTILES})
+            price_stats.append(stats)
+
+        return {
+            "total": sum(len(values) for values in prices.values()),
+            "matrix": [
+                {
+                    "category": category,
+                    "total": len(prices[category]),
+                    "statuses": {status: self.matrix[category][status] for status in STATUSES},
+                }
+                for category in categories
+            ],
+            "price_stats": price_stats,
+            "histogram": histogram(prices.values(), buckets),
+        }
+
+
+def summarize(rows: Iterable[tuple[str, str, Decimal]], buckets: int = 10) -> dict:
+    """Build the analytics summary from price-ordered ``(category, status, price)`` rows."""
+    builder = SummaryBuilder()
+    for row in rows:
+        builder.add(*row)
+    return builder.result(buckets)
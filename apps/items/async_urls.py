@@ -0,0 +1,16 @@
+from django.urls import path
+
+from . import async_views
+
+app_name = "async_items"
+
+urlpatterns = [
+    path("", async_views.item_list, name="item-list"),
+    path("<int:pk>/", async_views.item_detail, name="item-detail"),
+    path(
+        "analytics/category-density/",
+        async_views.category_density,
+        name="item-category-density",
+    ),
+    path("analytics/summary/", async_views.summary, name="item-summary"),
+]
@@ -0,0 +1,135 @@
+"""
+Native async (ASGI) item read endpoints, mounted under ``/api/async/items/``.
+
+They mirror ItemViewSet's list, retrieve and analytics actions (same filters,
+row serializer, pagination and error envelope) but await the async ORM, so a
+slow query parks a coroutine instead of tying up a whole worker. Queryset and
+filter construction is borrowed from an ItemViewSet instance.
+"""
+
+import asyncio
+import logging
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+from rest_framework import exceptions
+from rest_framework.request import Request
+
+from apps.core.exceptions import custom_exception_handler
+from apps.core.renderers import ORJSONRenderer
+from apps.users.authentication import CachedJWTAuthentication
+
+from . import counters
+from .analytics import SummaryBuilder
+from .models import Item
+from .views import ANALYTICS_CHUNK_SIZE, ItemViewSet
+
+logger = logging.getLogger(__name__)
+
+authentication = CachedJWTAuthentication()
+renderer = ORJSONRenderer()
+
+
+def async_api_view(action: str):
+    """
+    Turn ``async def view(viewset, **kwargs)`` into a GET-only Django view.
+
+    The request is authenticated with JWT, wrapped for an ItemViewSet bound
+    to ``action`` and throttled like it, and any exception is rendered through
+    ``custom_exception_handler``, exactly as the DRF views do.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request: HttpRequest, **kwargs) -> HttpResponse:
+            try:
+                if request.method not in ("GET", "HEAD"):
+                    raise exceptions.MethodNotAllowed(request.method)
+                viewset = await _get_viewset(request, action, kwargs)
+                data = await view(viewset, **kwargs)
+            except Exception as exc:
+                return _handle_exception(request, exc)
+            return HttpResponse(renderer.render(data), content_type=renderer.media_type)
+
+        return wrapper
+
+    return decorator
+
+
+async def _get_viewset(request: HttpRequest, action: str, kwargs: dict) -> ItemViewSet:
+    result = await authentication.aauthenticate(request)
+    if result is None:
+        raise exceptions.NotAuthenticated()
+
+    drf_request = Request(request, parsers=[], authenticators=[])
+    drf_request.user, drf_request.auth = result
+    viewset = ItemViewSet(request=drf_request, format_kwarg=None, action=action, kwargs=kwargs)
+    viewset.check_throttles(drf_request)
+    return viewset
+
+
+def _handle_exception(request: HttpRequest, exc: Exception) -> HttpResponse:
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        exc.auth_header = authentication.authenticate_header(request)
+    response = custom_exception_handler(exc, {"request": request, "view": None})
+    http_response = HttpResponse(
+        renderer.render(response.data),
+        status=response.status_code,
+        content_type=renderer.media_type,
+    )
+    for header, value in response.headers.items():
+        if header.lower() != "content-type":
+            http_response[header] = value
+    return http_response
+
+
+@async_api_view("list")
+async def item_list(viewset: ItemViewSet) -> dict:
+    """Async ``GET /api/items/``: page-number totals and rows are fetched concurrently."""
+    row_serializer = viewset.get_row_serializer()
+    # Filtering may introspect the search index once per process; keep that off the loop.
+    queryset = await sync_to_async(viewset.get_list_queryset)(row_serializer)
+
+    paginator = viewset.paginator
+    rows = await paginator.apaginate_queryset(queryset, viewset.request, view=viewset)
+    data = [row_serializer.to_representation(row) for row in rows]
+    return paginator.get_paginated_response(data).data
+
+
+@async_api_view("retrieve")
+async def item_detail(viewset: ItemViewSet, pk: int) -> dict:
+    """Async ``GET /api/items/{id}/``."""
+    row_serializer = viewset.get_row_serializer()
+    queryset = viewset.get_queryset().values(*row_serializer.columns)
+    try:
+        row = await queryset.aget(pk=pk)
+    except Item.DoesNotExist:
+        raise exceptions.NotFound("No Item matches the given query.")
+    return row_serializer.to_representation(row)
+
+
+@async_api_view("category_density")
+async def category_density(viewset: ItemViewSet) -> dict:
+    """Async ``GET /api/items/analytics/category-density/``; total and groups run concurrently."""
+    owner_id = viewset.request.user.pk
+    categories, total = await asyncio.gather(
+        counters.acategory_counts(owner_id),
+        counters.acounts(owner_id),
+    )
+    return {"success": True, "data": ItemViewSet.category_density_data(categories, total)}
+
+
+@async_api_view("summary")
+async def summary(viewset: ItemViewSet) -> dict:
+    """Async ``GET /api/items/analytics/summary/``, streamed with an async iterator."""
+    buckets = viewset.get_summary_buckets()
+    queryset = await sync_to_async(viewset.get_summary_queryset)()
+    # Django 4.2's plain values_list() iterable executes eagerly, outside the
+    # thread aiterator() hands it; the named variant is a lazy generator.
+    queryset = queryset.values_list("category", "status", "price", named=True)
+
+    builder = SummaryBuilder()
+    async for row in queryset.aiterator(chunk_size=ANALYTICS_CHUNK_SIZE):
+        builder.add(*row)
+    return {"success": True, "data": ItemViewSet.summary_data(builder.result(buckets))}
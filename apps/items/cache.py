@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.db import transaction
+
+from apps.core.response_cache import ResponseCache
+
+item_responses = ResponseCache(
+    "items",
+    alias=settings.RESPONSE_CACHE_ALIAS,
+    ttl=settings.RESPONSE_CACHE_TTL,
+    local_size=settings.RESPONSE_CACHE_LOCAL_SIZE,
+    local_ttl=settings.RESPONSE_CACHE_LOCAL_TTL,
+)
+
+
+def invalidate_owner(owner_id: int, using: str = "default") -> None:
+    """
+    Drop the owner's cached item responses now and again once the current
+    transaction commits: a read racing the write may cache pre-commit data
+    under the first new version, never under the second.
+    """
+    item_responses.bump(owner_id)
+    transaction.on_commit(lambda: item_responses.bump(owner_id), using=using)
@@ -0,0 +1,103 @@
+"""
+Reads, verification and rebuilds for the per-owner ItemCounter table.
+
+Writes happen next to the item writes themselves: ``Item.save()`` for single
+items and ``ItemCounter.objects.apply_moves()`` on the bulk paths.
+"""
+
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count, QuerySet, Sum
+
+from .cache import invalidate_owner
+from .models import Item, ItemCounter
+
+
+def _owner_counters(owner_id: int, category: str = None, status: str = None) -> QuerySet:
+    queryset = ItemCounter.objects.filter(owner_id=owner_id)
+    if category:
+        queryset = queryset.filter(category=category)
+    if status:
+        queryset = queryset.filter(status=status)
+    return queryset
+
+
+def _category_counts_queryset(owner_id: int) -> QuerySet:
+    return (
+        ItemCounter.objects.filter(owner_id=owner_id, count__gt=0)
+        .values("category")
+        .annotate(count=Sum("count"))
+        .order_by("-count", "category")
+    )
+
+
+def counts(owner_id: int, category: str = None, status: str = None) -> int:
+    """Total live items for an owner, optionally narrowed to a category and/or status."""
+    queryset = _owner_counters(owner_id, category, status)
+    return queryset.aggregate(total=Sum("count"))["total"] or 0
+
+
+async def acounts(owner_id: int, category: str = None, status: str = None) -> int:
+    """Async ORM variant of :func:`counts`."""
+    queryset = _owner_counters(owner_id, category, status)
+    return (await queryset.aaggregate(total=Sum("count")))["total"] or 0
+
+
+def category_counts(owner_id: int) -> list[dict]:
+    """``[{category, count}]`` for the owner, largest first."""
+    return list(_category_counts_queryset(owner_id))
+
+
+async def acategory_counts(owner_id: int) -> list[dict]:
+    """Async ORM variant of :func:`category_counts`."""
+    return [row async for row in _category_counts_queryset(owner_id)]
+
+
+def actual_counts(owner_ids: Iterable[int] = None) -> dict:
+    """``{(owner_id, category, status): count}`` computed from the items table."""
+    queryset = Item.objects.filter(is_deleted=False)
+    if owner_ids is not None:
+        queryset = queryset.filter(owner_id__in=owner_ids)
+    rows = queryset.values("owner_id", "category", "status").annotate(count=Count("pk"))
+    return {(r["owner_id"], r["category"], r["status"]): r["count"] for r in rows}
+
+
+def stored_counts(owner_ids: Iterable[int] = None) -> dict:
+    """``{(owner_id, category, status): count}`` as currently stored, zeros omitted."""
+    queryset = ItemCounter.objects.exclude(count=0)
+    if owner_ids is not None:
+        queryset = queryset.filter(owner_id__in=owner_ids)
+    rows = queryset.values_list("owner_id", "category", "status", "count")
+    return {(owner, category, status): count for owner, category, status, count in rows}
+
+
+def verify(owner_ids: Iterable[int] = None) -> list[tuple]:
+    """Return ``[(key, stored, actual)]`` for every counter that disagrees with the items."""
+    owner_ids = list(owner_ids) if owner_ids is not None else None
+    actual = actual_counts(owner_ids)
+    stored = stored_counts(owner_ids)
+    return [
+        (key, stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(actual.keys() | stored.keys())
+        if stored.get(key, 0) != actual.get(key, 0)
+    ]
+
+
+@transaction.atomic
+def rebuild(owner_ids: Iterable[int] = None) -> int:
+    """Recompute counters from the items table; returns the number of counter rows."""
+    owner_ids = list(owner_ids) if owner_ids is not None else None
+    existing = ItemCounter.objects.all()
+    if owner_ids is not None:
+        existing = existing.filter(owner_id__in=owner_ids)
+    affected = set(existing.values_list("owner_id", flat=True))
+    existing.delete()
+    counters = [
+        ItemCounter(owner_id=owner, category=category, status=status, count=count)
+        for (owner, category, status), count in actual_counts(owner_ids).items()
+    ]
+    ItemCounter.objects.bulk_create(counters, batch_size=1000)
+    for owner in affected | {counter.owner_id for counter in counters}:
+        invalidate_owner(owner)
+    return len(counters)
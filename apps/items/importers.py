@@ -0,0 +1,186 @@
+import codecs
+import csv
+import io
+import json
+import logging
+from collections.abc import Iterable, Iterator
+
+from django.db import connections, transaction
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.fields import SkipField, empty
+
+from .models import Item, ItemCounter
+from .serializers import ItemSerializer
+
+logger = logging.getLogger(__name__)
+
+IMPORT_COLUMNS = ["name", "description", "category", "status", "price"]
+IMPORT_BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+
+CSV_CONTENT_TYPES = {"text/csv"}
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/jsonl", "application/ndjson"}
+
+
+class ImportResult:
+    """Accepted/rejected row counts and the first MAX_REPORTED_ERRORS row errors."""
+
+    def __init__(self):
+        self.accepted = 0
+        self.rejected = 0
+        self.errors = []
+
+    def reject(self, line: int, errors) -> None:
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "errors": errors})
+
+    def as_dict(self) -> dict:
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "errors_truncated": self.rejected > len(self.errors),
+        }
+
+
+def iter_lines(stream) -> Iterator[str]:
+    """Decode a binary stream line by line without reading it all into memory."""
+    if stream is None:
+        return iter(())
+    return codecs.iterdecode(iter(stream.readline, b""), "utf-8-sig")
+
+
+def iter_csv_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict | None]]:
+    """Yield ``(line_number, row)`` for each CSV record after the header row."""
+    reader = csv.DictReader(lines)
+    start = 2
+    for row in reader:
+        yield start, {key: value for key, value in row.items() if key is not None}
+        start = reader.line_num + 1
+
+
+def iter_ndjson_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict | None]]:
+    """Yield ``(line_number, row)`` per non-blank line; ``row`` is None if unparsable."""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield number, row if isinstance(row, dict) else None
+
+
+class BatchValidator:
+    """
+    Apply ItemSerializer's field coercion and ``validate_<field>`` checks
+    column by column over a batch of raw rows.
+    """
+
+    def __init__(self):
+        self.serializer = ItemSerializer()
+        self.columns = [
+            (
+                name,
+                self.serializer.fields[name].run_validation,
+                getattr(self.serializer, f"validate_{name}", None),
+            )
+            for name in IMPORT_COLUMNS
+        ]
+
+    def validate(self, rows: list[dict]) -> tuple[list[dict], list[dict | None]]:
+        values = [{} for _ in rows]
+        errors = [{} for _ in rows]
+        for name, run_validation, validate in self.columns:
+            for raw_row, cleaned, row_errors in zip(rows, values, errors):
+                raw = raw_row.get(name, empty)
+                if raw == "" and name != "description":
+                    raw = empty
+                try:
+                    value = run_validation(raw)
+                    cleaned[name] = validate(value) if validate else value
+                except SkipField:
+                    pass
+                except serializers.ValidationError as exc:
+                    row_errors[name] = exc.detail
+        return values, [row_errors or None for row_errors in errors]
+
+
+def insert_items(rows: list[dict], owner_id: int, using: str = "default") -> None:
+    """Insert validated rows with COPY on PostgreSQL (psycopg2) or bulk_create elsewhere."""
+    now = timezone.now()
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, "copy_expert"):
+                _copy_items(raw, rows, owner_id, now)
+                return
+    Item.objects.using(using).bulk_create(
+        [Item(owner_id=owner_id, created_at=now, updated_at=now, **row) for row in rows]
+    )
+
+
+def _copy_items(cursor, rows: list[dict], owner_id: int, now) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            row["name"],
+            row.get("description", ""),
+            row["category"],
+            row.get("status", "active"),
+            row["price"],
+            owner_id,
+            now.isoformat(),
+            now.isoformat(),
+            "f",
+        ])
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {Item._meta.db_table} (name, description, category, status, price, "
+        "owner_id, created_at, updated_at, is_deleted) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+
+
+def import_items(records: Iterable[tuple[int, dict | None]], owner_id: int) -> ImportResult:
+    """
+    Validate and insert ``(line_number, row)`` records in IMPORT_BATCH_SIZE batches.
+
+    Each batch is committed on its own, so a failed row never discards the
+    rest of the upload; rejected rows are reported with their line number.
+    """
+    result = ImportResult()
+    validator = BatchValidator()
+
+    def flush(batch):
+        lines, rows = zip(*batch)
+        values, errors = validator.validate(list(rows))
+        accepted = [row for row, error in zip(values, errors) if error is None]
+        for line, error in zip(lines, errors):
+            if error is not None:
+                result.reject(line, error)
+        if accepted:
+            with transaction.atomic():
+                insert_items(accepted, owner_id)
+                ItemCounter.objects.apply_moves(
+                    owner_id,
+                    [(None, (row["category"], row.get("status", "active"))) for row in accepted],
+                )
+            result.accepted += len(accepted)
+
+    batch = []
+    for line, row in records:
+        if row is None:
+            result.reject(line, {"non_field_errors": ["Malformed row."]})
+            continue
+        batch.append((line, row))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    return result
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.items import counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-owner item counters from the items table, or verify them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--owner",
+            type=int,
+            action="append",
+            dest="owners",
+            help="Limit to this owner id (repeatable). Defaults to every owner.",
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare stored counters with the items table; exit non-zero on drift.",
+        )
+
+    def handle(self, *args, owners=None, verify=False, **options):
+        if verify:
+            mismatches = counters.verify(owners)
+            for (owner, category, status), stored, actual in mismatches:
+                self.stdout.write(
+                    f"owner={owner} category={category} status={status}: "
+                    f"stored={stored} actual={actual}"
+                )
+            if mismatches:
+                raise CommandError(f"{len(mismatches)} item counter(s) out of date.")
+            self.stdout.write(self.style.SUCCESS("Item counters are up to date."))
+            return
+
+        rows = counters.rebuild(owners)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} item counter row(s)."))
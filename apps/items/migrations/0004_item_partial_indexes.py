@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0003_item_idx_item_category_item_idx_item_status_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='item',
+            name='idx_item_category',
+        ),
+        migrations.RemoveIndex(
+            model_name='item',
+            name='idx_item_status',
+        ),
+        migrations.RemoveIndex(
+            model_name='item',
+            name='idx_item_owner_active',
+        ),
+        migrations.RemoveIndex(
+            model_name='item',
+            name='idx_item_created',
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['owner', '-created_at', '-id'], name='idx_item_owner_created'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['owner', 'category', '-created_at', '-id'], name='idx_item_owner_cat_created'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['owner', 'price', 'id'], name='idx_item_owner_price'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_counters(apps, schema_editor):
+    Item = apps.get_model('items', 'Item')
+    ItemCounter = apps.get_model('items', 'ItemCounter')
+    db = schema_editor.connection.alias
+    rows = (
+        Item.objects.using(db)
+        .filter(is_deleted=False)
+        .values('owner_id', 'category', 'status')
+        .annotate(count=models.Count('pk'))
+    )
+    ItemCounter.objects.using(db).bulk_create(
+        [ItemCounter(**row) for row in rows.iterator()], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('items', '0005_item_owner_updated_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ItemCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('electronics', 'Electronics'), ('clothing', 'Clothing'), ('food', 'Food'), ('books', 'Books'), ('other', 'Other')], max_length=50)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('inactive', 'Inactive'), ('archived', 'Archived')], max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('owner', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='item_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='itemcounter',
+            constraint=models.UniqueConstraint(fields=('owner', 'category', 'status'), name='uniq_item_counter'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+from collections import Counter
+
+from django.db import IntegrityError, models, router, transaction
+
+from .cache import invalidate_owner
 
 
 class Item(models.Model):
@@ -23,7 +27,7 @@ class Item(models.Model):
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="active")
     price = models.DecimalField(max_digits=10, decimal_places=2)
     owner = models.ForeignKey(
-        "users.User", on_delete=models.CASCADE, related_name="items"
+        "users.User", on_delete=models.CASCADE, related_name="items", db_index=False
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -31,12 +35,132 @@ class Item(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        # Partial indexes shaped after ItemViewSet.get_queryset(): every read is
+        # "owner = ? AND is_deleted = false", so soft-deleted rows stay out. The
+        # trailing id matches the keyset pagination tie-breaker.
+        # idx_item_owner_updated covers all rows: it backs the per-owner change
+        # marker used for ETags and doubles as the owner foreign-key index.
         indexes = [
-            models.Index(fields=["category"], name="idx_item_category"),
-            models.Index(fields=["status"], name="idx_item_status"),
-            models.Index(fields=["owner", "is_deleted"], name="idx_item_owner_active"),
-            models.Index(fields=["created_at"], name="idx_item_created"),
+            models.Index(fields=["owner", "updated_at"], name="idx_item_owner_updated"),
+            models.Index(
+                fields=["owner", "-created_at", "-id"],
+                name="idx_item_owner_created",
+                condition=models.Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=["owner", "category", "-created_at", "-id"],
+                name="idx_item_owner_cat_created",
+                condition=models.Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=["owner", "price", "id"],
+                name="idx_item_owner_price",
+                condition=models.Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self) -> str:
         return self.name
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if COUNTER_FIELDS.issubset(field_names):
+            instance._saved_counter_key = instance.counter_key
+        return instance
+
+    @property
+    def counter_key(self) -> tuple[str, str] | None:
+        """The (category, status) counter this item counts towards; None once soft-deleted."""
+        return None if self.is_deleted else (self.category, self.status)
+
+    def save(self, *args, **kwargs):
+        """
+        Save and move the item between ItemCounter rows in the same transaction;
+        the owner's cached item responses are invalidated.
+        """
+        using = kwargs.get("using") or router.db_for_write(Item, instance=self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not COUNTER_FIELDS.intersection(update_fields):
+            super().save(*args, **kwargs)
+            invalidate_owner(self.owner_id, using=using)
+            return
+
+        with transaction.atomic(using=using):
+            if hasattr(self, "_saved_counter_key"):
+                before = self._saved_counter_key
+            elif self._state.adding and self.pk is None:
+                before = None
+            else:
+                stored = Item.objects.using(using).filter(pk=self.pk).first()
+                before = stored.counter_key if stored else None
+            super().save(*args, **kwargs)
+            ItemCounter.objects.db_manager(using).apply_moves(
+                self.owner_id, [(before, self.counter_key)]
+            )
+            invalidate_owner(self.owner_id, using=using)
+        self._saved_counter_key = self.counter_key
+
+
+COUNTER_FIELDS = {"category", "status", "is_deleted"}
+
+
+class ItemCounterManager(models.Manager):
+    def apply_moves(self, owner_id: int, moves) -> None:
+        """
+        Apply ``(before, after)`` counter-key pairs for items of one owner.
+
+        A key of None means "not counted" (a new or soft-deleted item), so
+        ``(None, key)`` is a create and ``(key, None)`` a soft-delete.
+        """
+        deltas = Counter()
+        for before, after in moves:
+            if before != after:
+                if before is not None:
+                    deltas[before] -= 1
+                if after is not None:
+                    deltas[after] += 1
+        self.apply_deltas(owner_id, deltas)
+
+    def apply_deltas(self, owner_id: int, deltas: Counter) -> None:
+        """Add ``{(category, status): delta}``; one UPDATE per changed key."""
+        for (category, status), delta in deltas.items():
+            if not delta:
+                continue
+            counter = self.filter(owner_id=owner_id, category=category, status=status)
+            if counter.update(count=models.F("count") + delta):
+                continue
+            try:
+                with transaction.atomic(using=self.db):
+                    self.create(owner_id=owner_id, category=category, status=status, count=delta)
+            except IntegrityError:
+                counter.update(count=models.F("count") + delta)
+
+
+class ItemCounter(models.Model):
+    """
+    Live (non-deleted) item count per owner, category and status.
+
+    ``Item.save()`` keeps it in step; bulk write paths call
+    ``ItemCounter.objects.apply_moves()`` themselves.
+    ``manage.py rebuild_item_counters`` rebuilds or verifies it.
+    """
+
+    owner = models.ForeignKey(
+        "users.User", on_delete=models.CASCADE, related_name="item_counters", db_index=False
+    )
+    category = models.CharField(max_length=50, choices=Item.CATEGORY_CHOICES)
+    status = models.CharField(max_length=50, choices=Item.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    objects = ItemCounterManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "category", "status"], name="uniq_item_counter"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.owner_id}/{self.category}/{self.status}: {self.count}"
@@ -0,0 +1,163 @@
+import logging
+import re
+
+from django.db import DatabaseError, connections
+from django.db.models import BooleanField, FloatField, QuerySet
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from .models import Item
+
+logger = logging.getLogger(__name__)
+
+TABLE = Item._meta.db_table
+FTS_TABLE = f"{TABLE}_fts"
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Name matches weigh more than description matches on both backends.
+POSTGRES_DDL = [
+    f"""
+    ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_item_search ON {TABLE} USING gin ({SEARCH_VECTOR_COLUMN})",
+]
+
+SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+    USING fts5(name, description, content='{TABLE}', content_rowid='id')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name, description ON {TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+]
+
+_available: dict[str, bool] = {}
+
+
+def install_search_index(using: str = "default") -> None:
+    """
+    Create the search-vector column (PostgreSQL) or FTS5 shadow table (SQLite).
+
+    Idempotent; runs on ``post_migrate`` so it also covers databases built
+    without migrations (e.g. the pytest ``--nomigrations`` test database).
+    """
+    connection = connections[using]
+    _available.pop(using, None)
+    if connection.vendor == "postgresql":
+        statements = POSTGRES_DDL
+    elif connection.vendor == "sqlite":
+        statements = SQLITE_DDL
+    else:
+        return
+
+    with connection.cursor() as cursor:
+        rebuild = statements is SQLITE_DDL and (
+            FTS_TABLE not in connection.introspection.table_names(cursor)
+        )
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        except DatabaseError:
+            logger.warning("Full-text search index unavailable on '%s'.", using, exc_info=True)
+            return
+        if rebuild:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def search_index_available(using: str) -> bool:
+    if using not in _available:
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                columns = connection.introspection.get_table_description(cursor, TABLE)
+                _available[using] = any(c.name == SEARCH_VECTOR_COLUMN for c in columns)
+            elif connection.vendor == "sqlite":
+                _available[using] = FTS_TABLE in connection.introspection.table_names(cursor)
+            else:
+                _available[using] = False
+    return _available[using]
+
+
+def search_terms(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def full_text_search(queryset: QuerySet, text: str) -> QuerySet:
+    """
+    Filter ``queryset`` to rows matching every term of ``text`` as a word prefix
+    and annotate them with ``search_rank`` (higher is more relevant).
+    """
+    terms = search_terms(text)
+    if not terms:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        query = " & ".join(f"{term}:*" for term in terms)
+        tsquery = "to_tsquery('simple', %s)"
+        column = f"{TABLE}.{SEARCH_VECTOR_COLUMN}"
+        match = RawSQL(f"{column} @@ {tsquery}", [query], output_field=BooleanField())
+        rank = RawSQL(f"ts_rank({column}, {tsquery})", [query], output_field=FloatField())
+    else:
+        query = " ".join(f'"{term}"*' for term in terms)
+        match = RawSQL(
+            f"{TABLE}.id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)",
+            [query],
+            output_field=BooleanField(),
+        )
+        rank = RawSQL(
+            f"(SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = {TABLE}.id)",
+            [query],
+            output_field=FloatField(),
+        )
+    return queryset.filter(match).annotate(search_rank=rank)
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    ``?search=`` backed by the full-text index, ranked by relevance.
+
+    Must run after ``OrderingFilter``: without an explicit ``ordering``
+    parameter results are ordered by rank, then by the default ordering.
+    Falls back to DRF's ``icontains`` search when no index is available.
+    """
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view) -> QuerySet:
+        text = request.query_params.get(self.search_param, "")
+        if not text.strip():
+            return queryset
+        if not search_index_available(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = full_text_search(queryset, text)
+        if "search_rank" in queryset.query.annotations and (
+            api_settings.ORDERING_PARAM not in request.query_params
+        ):
+            queryset = queryset.order_by("-search_rank", *queryset.query.order_by)
+        return queryset
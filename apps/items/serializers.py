@@ -1,10 +1,59 @@
+from collections import Counter
 from decimal import Decimal
 
+from django.utils import timezone
 from rest_framework import serializers
 
 from .models import Item
 
 
+class ItemListSerializer(serializers.ListSerializer):
+    """
+    ``ItemSerializer(many=True)`` that writes a whole batch at once.
+
+    Creation goes through a single ``bulk_create``. For updates, pass
+    ``instance`` as a ``{pk: Item}`` mapping; each row must carry an ``id``
+    from that mapping and is validated against its instance.
+    """
+
+    def to_internal_value(self, data):
+        if self.instance is not None and isinstance(data, list):
+            self._id_counts = Counter(_row_id(row) for row in data)
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if self.instance is None:
+            return super().run_child_validation(data)
+
+        pk = _row_id(data)
+        if pk is None:
+            raise serializers.ValidationError({"id": ["A valid item id is required."]})
+        if pk not in self.instance:
+            raise serializers.ValidationError({"id": ["Item not found."]})
+        if self._id_counts[pk] > 1:
+            raise serializers.ValidationError({"id": ["Duplicate item id."]})
+        self.child.instance = self.instance[pk]
+        self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def create(self, validated_data: list) -> list:
+        items = [Item(**attrs) for attrs in validated_data]
+        return Item.objects.bulk_create(items)
+
+    def update(self, instance: dict, validated_data: list) -> list:
+        now = timezone.now()
+        items, fields = [], {"updated_at"}
+        for row, attrs in zip(self.initial_data, validated_data):
+            item = instance[_row_id(row)]
+            for field, value in attrs.items():
+                setattr(item, field, value)
+            item.updated_at = now
+            fields.update(attrs)
+            items.append(item)
+        Item.objects.bulk_update(items, sorted(fields))
+        return items
+
+
 class ItemSerializer(serializers.ModelSerializer):
     """Serializer for Item CRUD operations."""
 
@@ -24,6 +73,7 @@ class ItemSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "owner", "created_at", "updated_at"]
+        list_serializer_class = ItemListSerializer
 
     def validate_price(self, value: Decimal) -> Decimal:
         """Ensure price is a positive number."""
@@ -38,9 +88,73 @@ class ItemSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
+class BulkDeleteSerializer(serializers.Serializer):
+    """Input for bulk soft-delete: a list of item ids."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+    )
+
+
 class CategoryDensitySerializer(serializers.Serializer):
     """Read-only serializer for category analytics response."""
 
     category = serializers.CharField()
     count = serializers.IntegerField()
     percentage = serializers.FloatField()
+
+
+class AnalyticsSummaryQuerySerializer(serializers.Serializer):
+    """Query parameters for the analytics summary endpoint."""
+
+    buckets = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+
+class CategoryStatusSerializer(serializers.Serializer):
+    """One row of the category × status matrix."""
+
+    category = serializers.CharField()
+    total = serializers.IntegerField()
+    statuses = serializers.DictField(child=serializers.IntegerField())
+
+
+class PriceStatsSerializer(serializers.Serializer):
+    """Price distribution for one category."""
+
+    category = serializers.CharField()
+    count = serializers.IntegerField()
+    min = serializers.FloatField()
+    max = serializers.FloatField()
+    avg = serializers.FloatField()
+    p25 = serializers.FloatField()
+    p50 = serializers.FloatField()
+    p75 = serializers.FloatField()
+    p90 = serializers.FloatField()
+    p95 = serializers.FloatField()
+    p99 = serializers.FloatField()
+
+    def to_representation(self, instance):
+        return _rounded(super().to_representation(instance))
+
+
+class HistogramBucketSerializer(serializers.Serializer):
+    """One equal-width price bucket."""
+
+    lower = serializers.FloatField()
+    upper = serializers.FloatField()
+    count = serializers.IntegerField()
+
+    def to_representation(self, instance):
+        return _rounded(super().to_representation(instance))
+
+
+def _rounded(data: dict) -> dict:
+    return {key: round(value, 2) if isinstance(value, float) else value for key, value in data.items()}
+
+
+def _row_id(row) -> int | None:
+    try:
+        return int(row["id"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,107 @@
+"""
+Query-plan regression tests for the Item hot paths.
+
+Each test builds the queryset exactly as ``ItemViewSet`` does and asserts,
+through EXPLAIN, that it is answered from one of the item indexes rather
+than a full table scan. Runs against SQLite and PostgreSQL.
+"""
+
+import pytest
+from django.db import connection
+from django.db.models import Count, Max, Sum
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.core.pagination import KeysetPagination
+from apps.items.models import Item, ItemCounter
+from apps.items.views import ItemViewSet
+
+OWNER_CREATED = "idx_item_owner_created"
+OWNER_CATEGORY = "idx_item_owner_cat_created"
+OWNER_PRICE = "idx_item_owner_price"
+OWNER_UPDATED = "idx_item_owner_updated"
+
+
+@pytest.fixture
+def items(user):
+    for i, category in enumerate(["books", "electronics", "food", "books"]):
+        Item.objects.create(name=f"Item {i}", category=category, price=10 + i, owner=user)
+    Item.objects.create(name="Gone", category="books", price=1, owner=user, is_deleted=True)
+
+
+@pytest.fixture(autouse=True)
+def _prefer_indexes(db):
+    # A handful of rows always favours a sequential scan on PostgreSQL; the
+    # question here is whether a usable index exists, not the cost estimate.
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+
+def list_queryset(user, params=None):
+    request = Request(APIRequestFactory().get("/api/items/", params or {}))
+    request.user = user
+    view = ItemViewSet(request=request, format_kwarg=None, action="list")
+    return view.filter_queryset(view.get_queryset())
+
+
+def assert_uses_index(queryset, *index_names):
+    plan = queryset.explain()
+    assert any(name in plan for name in index_names), plan
+    if connection.vendor == "postgresql":
+        assert "Seq Scan" not in plan, plan
+    else:
+        assert f"SCAN {Item._meta.db_table}" not in plan.replace("COVERING ", ""), plan
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("items")
+class TestItemQueryPlans:
+    def test_default_list(self, user):
+        assert_uses_index(list_queryset(user)[:10], OWNER_CREATED)
+
+    def test_keyset_page(self, user):
+        queryset = list_queryset(user)
+        ordering = KeysetPagination().get_ordering(queryset)
+        latest = queryset.first()
+        page = queryset.order_by(*ordering).filter(
+            KeysetPagination._after(ordering, [latest.created_at, latest.pk])
+        )
+
+        assert_uses_index(page[:11], OWNER_CREATED)
+
+    def test_category_filter(self, user):
+        assert_uses_index(list_queryset(user, {"category": "books"})[:10], OWNER_CATEGORY)
+
+    def test_status_filter(self, user):
+        assert_uses_index(list_queryset(user, {"status": "active"})[:10], OWNER_CREATED)
+
+    def test_price_range_filter(self, user):
+        queryset = list_queryset(user, {"min_price": 10, "max_price": 12})
+
+        assert_uses_index(queryset[:10], OWNER_PRICE, OWNER_CREATED)
+
+    def test_price_ordering(self, user):
+        assert_uses_index(list_queryset(user, {"ordering": "-price"})[:10], OWNER_PRICE)
+
+    def test_category_density(self, user):
+        queryset = list_queryset(user).values("category").annotate(count=Count("id"))
+
+        assert_uses_index(queryset.order_by("-count"), OWNER_CATEGORY, OWNER_CREATED)
+
+    def test_change_marker(self, user):
+        queryset = Item.objects.filter(owner=user).values("owner").annotate(
+            last_modified=Max("updated_at"), rows=Count("pk")
+        )
+
+        assert_uses_index(queryset, OWNER_UPDATED)
+
+    def test_counter_lookup(self, user):
+        queryset = (
+            ItemCounter.objects.filter(owner=user, count__gt=0)
+            .values("category")
+            .annotate(count=Sum("count"))
+        )
+
+        # SQLite names the index backing a table-level UNIQUE constraint itself.
+        assert_uses_index(queryset, "uniq_item_counter", "sqlite_autoindex_items_itemcounter")
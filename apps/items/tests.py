@@ -1,8 +1,20 @@
+import csv
+import io
+import json
+
 import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
-from apps.items.models import Item
+from apps.items import counters
+from apps.items.cache import item_responses
+from apps.items.models import Item, ItemCounter
+from apps.items.serializers import ItemSerializer
+from apps.users.models import User
 
 
 # ─── Helper ────────────────────────────────────────
@@ -87,6 +99,67 @@ class TestItemList:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 0
 
+    def test_list_matches_item_serializer(self, auth_client, user):
+        for price in ["29.99", "5", "1234.5"]:
+            Item.objects.create(name=f"Item {price}", category="books", price=price, owner=user)
+
+        response = auth_client.get(reverse("items:item-list"))
+
+        expected = ItemSerializer(Item.objects.order_by("-created_at"), many=True).data
+        assert response.data["results"] == [dict(item) for item in expected]
+
+    def test_list_does_not_join_owner(self, auth_client, sample_item):
+        with CaptureQueriesContext(connection) as ctx:
+            auth_client.get(reverse("items:item-list"))
+
+        item_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "items_item"' in q["sql"]]
+        assert item_queries
+        assert not any("users_user" in sql for sql in item_queries)
+
+
+@pytest.mark.django_db
+class TestItemSparseFields:
+    url = reverse("items:item-list")
+
+    def test_sparse_fields(self, auth_client, sample_item):
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.get(self.url, {"fields": "price,id,name"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == [
+            {"id": sample_item.pk, "name": "Test Item", "price": "29.99"}
+        ]
+        page_query = next(q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"])
+        assert '"items_item"."description"' not in page_query
+
+    def test_sparse_fields_with_cursor(self, auth_client, user):
+        for i in range(3):
+            Item.objects.create(name=f"Item {i}", category="books", price=10 + i, owner=user)
+
+        response = auth_client.get(
+            self.url, {"fields": "name", "cursor": "", "per_page": 2, "ordering": "price"}
+        )
+        names = [row["name"] for row in response.data["results"]]
+        names += [row["name"] for row in auth_client.get(response.data["next"]).data["results"]]
+
+        assert response.data["results"][0] == {"name": "Item 0"}
+        assert names == ["Item 0", "Item 1", "Item 2"]
+
+    def test_unknown_field(self, auth_client):
+        response = auth_client.get(self.url, {"fields": "name,secret"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "VALIDATION_ERROR"
+        assert response.data["details"] == {"fields": ["secret"]}
+
+    def test_export_sparse_fields(self, auth_client, sample_item):
+        response = auth_client.get(
+            reverse("items:item-export"), {"format": "csv", "fields": "name,owner"}
+        )
+
+        content = b"".join(response.streaming_content).decode()
+        assert content.splitlines() == ["name,owner", f"Test Item,{sample_item.owner.email}"]
+
 
 @pytest.mark.django_db
 class TestItemDetail:
@@ -134,6 +207,416 @@ class TestItemDelete:
         assert sample_item.is_deleted is True
 
 
+@pytest.mark.django_db
+class TestItemCursorPagination:
+    def _walk(self, client, params):
+        url = reverse("items:item-list")
+        names, response = [], client.get(url, {"cursor": "", **params})
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            names.extend(item["name"] for item in response.data["results"])
+            if not response.data["next"]:
+                return names
+            response = client.get(response.data["next"])
+
+    def test_cursor_walks_all_items_newest_first(self, auth_client, user):
+        for i in range(7):
+            Item.objects.create(name=f"Item {i}", category="books", price="10", owner=user)
+
+        names = self._walk(auth_client, {"per_page": 3})
+
+        assert names == [f"Item {i}" for i in reversed(range(7))]
+
+    def test_cursor_with_ordering_and_ties(self, auth_client, user):
+        for i, price in enumerate(["5", "1", "5", "3", "5", "1"]):
+            Item.objects.create(name=f"Item {i}", category="books", price=price, owner=user)
+
+        names = self._walk(auth_client, {"per_page": 2, "ordering": "-price"})
+
+        assert names == ["Item 4", "Item 2", "Item 0", "Item 3", "Item 5", "Item 1"]
+
+    def test_cursor_respects_filters(self, auth_client, user):
+        for i in range(4):
+            Item.objects.create(name=f"Book {i}", category="books", price="10", owner=user)
+        Item.objects.create(name="Phone", category="electronics", price="10", owner=user)
+
+        names = self._walk(auth_client, {"per_page": 3, "category": "books"})
+
+        assert sorted(names) == [f"Book {i}" for i in range(4)]
+
+    def test_cursor_never_counts(self, auth_client, sample_item):
+        url = reverse("items:item-list")
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.get(url, {"cursor": ""})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert not any("__count" in q["sql"] for q in ctx.captured_queries)
+
+    def test_cursor_rejects_mismatched_ordering(self, auth_client, user):
+        for i in range(3):
+            Item.objects.create(name=f"Item {i}", category="books", price="10", owner=user)
+        url = reverse("items:item-list")
+        first = auth_client.get(url, {"cursor": "", "per_page": 1})
+        cursor = first.data["next"].split("cursor=")[1].split("&")[0]
+
+        response = auth_client.get(url, {"cursor": cursor, "ordering": "price"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_cursor(self, auth_client, sample_item):
+        url = reverse("items:item-list")
+        response = auth_client.get(url, {"cursor": "not-a-cursor"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestItemBulk:
+    url = reverse("items:item-bulk-create")
+
+    def test_bulk_create(self, auth_client, user):
+        payload = [
+            {"name": f"Item {i}", "category": "books", "price": f"{i + 1}.50"} for i in range(50)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.post(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"]["created"] == 50
+        assert all(item["id"] for item in response.data["data"]["items"])
+        assert Item.objects.filter(owner=user).count() == 50
+        inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "items_item"')
+        ]
+        assert len(inserts) == 1
+
+    def test_bulk_create_reports_row_errors(self, auth_client, user):
+        payload = [
+            {"name": "Good", "category": "books", "price": "10"},
+            {"name": "  ", "category": "books", "price": "10"},
+            {"name": "Cheap", "category": "books", "price": "-1"},
+        ]
+        response = auth_client.post(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "VALIDATION_ERROR"
+        rows = response.data["details"]["rows"]
+        assert [row["index"] for row in rows] == [1, 2]
+        assert "price" in rows[1]["errors"]
+        assert not Item.objects.exists()
+
+    def test_bulk_create_rejects_non_list_and_oversized(self, auth_client):
+        response = auth_client.post(self.url, {"name": "x"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        payload = [{"name": "x", "category": "books", "price": "1"}] * 5001
+        response = auth_client.post(self.url, payload, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_update(self, auth_client, user):
+        items = [
+            Item.objects.create(name=f"Item {i}", category="books", price="10", owner=user)
+            for i in range(3)
+        ]
+        payload = [{"id": item.pk, "price": "99.00"} for item in items[:2]]
+        payload[1]["status"] = "archived"
+
+        response = auth_client.patch(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["updated"] == 2
+        prices = dict(Item.objects.values_list("name", "price"))
+        assert [str(prices[f"Item {i}"]) for i in range(3)] == ["99.00", "99.00", "10.00"]
+        assert Item.objects.get(pk=items[1].pk).status == "archived"
+
+    def test_bulk_update_unknown_and_foreign_ids(self, auth_client, user, sample_item):
+        other = User.objects.create_user(
+            email="other@example.com", password="pass12345", first_name="O", last_name="U",
+        )
+        foreign = Item.objects.create(name="Theirs", category="books", price="1", owner=other)
+        payload = [
+            {"id": sample_item.pk, "name": "Renamed"},
+            {"id": foreign.pk, "name": "Stolen"},
+            {"name": "No id"},
+        ]
+
+        response = auth_client.patch(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [row["index"] for row in response.data["details"]["rows"]] == [1, 2]
+        sample_item.refresh_from_db()
+        assert sample_item.name == "Test Item"
+
+    def test_bulk_soft_delete(self, auth_client, user):
+        items = [
+            Item.objects.create(name=f"Item {i}", category="books", price="10", owner=user)
+            for i in range(3)
+        ]
+        ids = [items[0].pk, items[1].pk, 9999]
+
+        response = auth_client.delete(self.url, {"ids": ids}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == {"deleted": 2, "not_found": [9999]}
+        assert list(Item.objects.filter(is_deleted=False)) == [items[2]]
+
+
+@pytest.mark.django_db
+class TestItemExport:
+    url = reverse("items:item-export")
+
+    def _content(self, response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson_matches_item_serializer(self, auth_client, sample_item):
+        response = auth_client.get(self.url, {"format": "ndjson"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        assert "attachment" in response["Content-Disposition"]
+        lines = self._content(response).splitlines()
+        detail = auth_client.get(reverse("items:item-detail", kwargs={"pk": sample_item.pk}))
+        assert [json.loads(line) for line in lines] == [json.loads(json.dumps(detail.data))]
+
+    def test_export_csv_with_filters_and_ordering(self, auth_client, user):
+        for i, category in enumerate(["books", "electronics", "books"]):
+            Item.objects.create(name=f"Item {i}", category=category, price=10 + i, owner=user)
+
+        response = auth_client.get(
+            self.url, {"format": "csv", "category": "books", "ordering": "price"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(self._content(response))))
+        assert [row["name"] for row in rows] == ["Item 0", "Item 2"]
+        assert rows[0]["price"] == "10.00"
+        assert rows[0]["owner"] == user.email
+
+    def test_export_streams_in_chunks(self, auth_client, user):
+        Item.objects.bulk_create(
+            Item(name=f"Item {i}", category="books", price="1", owner=user) for i in range(1200)
+        )
+
+        response = auth_client.get(self.url, {"format": "ndjson"})
+        chunks = list(response.streaming_content)
+
+        assert len(chunks) > 1
+        assert sum(chunk.count(b"\n") for chunk in chunks) == 1200
+
+    def test_export_unauthenticated(self, api_client):
+        response = api_client.get(self.url, {"format": "csv"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestItemImport:
+    url = reverse("items:item-bulk-import")
+
+    def test_import_csv(self, auth_client, user):
+        body = (
+            "name,description,category,status,price\n"
+            "Phone,\"multi\nline\",electronics,active,999.99\n"
+            " ,,books,,10\n"
+            "Book,,books,,-5\n"
+            "Shirt,,clothing,archived,29\n"
+        )
+        response = auth_client.post(self.url, body.encode(), content_type="text/csv")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert (data["accepted"], data["rejected"]) == (2, 2)
+        assert [error["line"] for error in data["errors"]] == [4, 5]
+        assert "name" in data["errors"][0]["errors"]
+        assert "price" in data["errors"][1]["errors"]
+        phone = Item.objects.get(name="Phone")
+        assert (phone.owner, phone.status, phone.description) == (user, "active", "multi\nline")
+        assert Item.objects.get(name="Shirt").status == "archived"
+
+    def test_import_ndjson(self, auth_client, user):
+        lines = [
+            json.dumps({"name": "A", "category": "books", "price": 1.5}),
+            "",
+            "{not json",
+            json.dumps({"name": "B", "category": "toys", "price": "2"}),
+            json.dumps({"name": "C", "category": "food", "price": "3", "status": "inactive"}),
+        ]
+        response = auth_client.post(
+            self.url, "\n".join(lines).encode(), content_type="application/x-ndjson"
+        )
+
+        data = response.data["data"]
+        assert (data["accepted"], data["rejected"]) == (2, 2)
+        assert [error["line"] for error in data["errors"]] == [3, 4]
+        assert "category" in data["errors"][1]["errors"]
+        assert sorted(Item.objects.values_list("name", flat=True)) == ["A", "C"]
+
+    def test_import_batches(self, auth_client, user, monkeypatch):
+        monkeypatch.setattr("apps.items.importers.IMPORT_BATCH_SIZE", 10)
+        body = "name,category,price\n" + "".join(f"Item {i},books,{i + 1}\n" for i in range(25))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.post(self.url, body.encode(), content_type="text/csv")
+
+        assert response.data["data"]["accepted"] == 25
+        assert Item.objects.filter(owner=user).count() == 25
+        inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "items_item"')
+        ]
+        assert len(inserts) == 3
+
+    def test_import_unsupported_content_type(self, auth_client):
+        response = auth_client.post(self.url, {"name": "x"}, format="json")
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+@pytest.mark.django_db
+class TestItemConditionalGet:
+    def test_list_not_modified(self, auth_client, sample_item):
+        url = reverse("items:item-list")
+        first = auth_client.get(url)
+        etag = first["ETag"]
+
+        assert first.has_header("Last-Modified")
+        assert "Authorization" in first["Vary"]
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not any('"items_item"."name"' in q["sql"] for q in ctx.captured_queries)
+
+    def test_etag_changes_on_write(self, auth_client, sample_item, item_payload):
+        url = reverse("items:item-list")
+        etag = auth_client.get(url)["ETag"]
+
+        auth_client.post(url, item_payload)
+        assert auth_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+        etag = auth_client.get(url)["ETag"]
+        auth_client.delete(reverse("items:item-detail", kwargs={"pk": sample_item.pk}))
+        assert auth_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_etag_depends_on_query(self, auth_client, sample_item):
+        url = reverse("items:item-list")
+
+        assert auth_client.get(url)["ETag"] != auth_client.get(url, {"ordering": "price"})["ETag"]
+
+    def test_detail_and_analytics_not_modified(self, auth_client, sample_item):
+        for url in [
+            reverse("items:item-detail", kwargs={"pk": sample_item.pk}),
+            reverse("items:item-category-density"),
+        ]:
+            etag = auth_client.get(url)["ETag"]
+            response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_is_per_user(self, auth_client, api_client, sample_item):
+        url = reverse("items:item-list")
+        etag = auth_client.get(url)["ETag"]
+        other = User.objects.create_user(
+            email="other@example.com", password="pass12345", first_name="O", last_name="U",
+        )
+        other_client = type(api_client)()
+        other_client.force_authenticate(other)
+
+        assert other_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+
+# ─── Response Cache Tests ──────────────────────────
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    list_url = reverse("items:item-list")
+
+    def test_repeat_read_is_served_without_queries(self, auth_client, sample_item):
+        first = auth_client.get(self.list_url, {"ordering": "price", "per_page": 5})
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = auth_client.get(self.list_url, {"per_page": 5, "ordering": "price"})
+
+        assert (first["X-Cache"], second["X-Cache"]) == ("MISS", "HIT")
+        assert len(ctx.captured_queries) == 0
+        assert second.json() == json.loads(first.content)
+        assert second["ETag"] == first["ETag"]
+        assert "Authorization" in second["Vary"]
+
+    def test_hit_honours_if_none_match(self, auth_client, sample_item):
+        etag = auth_client.get(self.list_url)["ETag"]
+
+        response = auth_client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda client, item: client.post(
+                reverse("items:item-list"), {"name": "N", "category": "books", "price": "1"}
+            ),
+            lambda client, item: client.patch(
+                reverse("items:item-detail", kwargs={"pk": item.pk}), {"name": "Renamed"}
+            ),
+            lambda client, item: client.delete(
+                reverse("items:item-detail", kwargs={"pk": item.pk})
+            ),
+            lambda client, item: client.post(
+                reverse("items:item-bulk-create"),
+                [{"name": "B", "category": "food", "price": "2"}],
+                format="json",
+            ),
+            lambda client, item: client.patch(
+                reverse("items:item-bulk-create"),
+                [{"id": item.pk, "status": "archived"}],
+                format="json",
+            ),
+            lambda client, item: client.delete(
+                reverse("items:item-bulk-create"), {"ids": [item.pk]}, format="json"
+            ),
+        ],
+    )
+    def test_writes_invalidate_every_read(self, auth_client, sample_item, write):
+        urls = [
+            self.list_url,
+            reverse("items:item-detail", kwargs={"pk": sample_item.pk}),
+            reverse("items:item-category-density"),
+            reverse("items:item-summary"),
+        ]
+        before = [auth_client.get(url).content for url in urls]
+
+        write(auth_client, sample_item)
+
+        after = [auth_client.get(url) for url in urls]
+        assert all(r["X-Cache"] == "MISS" for r in after if r.status_code == status.HTTP_200_OK)
+        assert [r.content for r in after] != before
+
+    def test_cache_is_per_owner(self, auth_client, sample_item):
+        auth_client.get(self.list_url)
+        other = User.objects.create_user(
+            email="other@example.com", password="pass12345", first_name="O", last_name="U",
+        )
+        other_client = type(auth_client)()
+        other_client.force_authenticate(other)
+
+        response = other_client.get(self.list_url)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["count"] == 0
+
+    def test_stats_count_hits_and_misses(self, auth_client, sample_item):
+        auth_client.get(self.list_url)
+        auth_client.get(self.list_url)
+        item_responses.local.clear()
+        auth_client.get(self.list_url)
+
+        stats = item_responses.stats()
+
+        assert (stats["misses"], stats["local_hits"], stats["shared_hits"]) == (1, 1, 1)
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
 # ─── Filter Tests ──────────────────────────────────
 
 
@@ -172,6 +655,79 @@ class TestItemFilter:
         assert len(response.data["results"]) == 1
 
 
+@pytest.mark.django_db
+class TestItemSearch:
+    def test_search_matches_word_prefixes(self, auth_client, user):
+        Item.objects.create(name="iPhone 15", category="electronics", price="999", owner=user)
+        Item.objects.create(name="Python Book", category="books", price="29", owner=user)
+
+        url = reverse("items:item-list")
+        response = auth_client.get(url, {"search": "iphon"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [i["name"] for i in response.data["results"]] == ["iPhone 15"]
+
+    def test_search_ranks_name_matches_first(self, auth_client, user):
+        Item.objects.create(
+            name="Cable", description="works with any phone", category="other",
+            price="5", owner=user,
+        )
+        Item.objects.create(name="Phone", category="electronics", price="999", owner=user)
+        Item.objects.create(name="Lamp", category="other", price="20", owner=user)
+
+        url = reverse("items:item-list")
+        response = auth_client.get(url, {"search": "phone"})
+
+        assert [i["name"] for i in response.data["results"]] == ["Phone", "Cable"]
+        assert response.data["count"] == 2
+
+    def test_search_tracks_updates_and_combines_with_filters(self, auth_client, user):
+        item = Item.objects.create(name="Old Name", category="books", price="10", owner=user)
+        Item.objects.create(name="Guitar", category="other", price="10", owner=user)
+        item.name = "Guitar Book"
+        item.save()
+
+        url = reverse("items:item-list")
+        response = auth_client.get(url, {"search": "guitar", "category": "books"})
+
+        assert [i["name"] for i in response.data["results"]] == ["Guitar Book"]
+        assert auth_client.get(url, {"search": "old"}).data["count"] == 0
+
+    def test_search_explicit_ordering_wins(self, auth_client, user):
+        Item.objects.create(name="Phone", category="electronics", price="999", owner=user)
+        Item.objects.create(
+            name="Cable", description="phone cable", category="other", price="5", owner=user,
+        )
+
+        url = reverse("items:item-list")
+        response = auth_client.get(url, {"search": "phone", "ordering": "price"})
+
+        assert [i["name"] for i in response.data["results"]] == ["Cable", "Phone"]
+
+    def test_search_with_cursor_pagination(self, auth_client, user):
+        for i in range(5):
+            Item.objects.create(name=f"Phone {i}", category="electronics", price="9", owner=user)
+
+        url = reverse("items:item-list")
+        first = auth_client.get(url, {"search": "phone", "cursor": "", "per_page": 3})
+        second = auth_client.get(first.data["next"])
+
+        names = [i["name"] for i in first.data["results"] + second.data["results"]]
+        assert sorted(names) == [f"Phone {i}" for i in range(5)]
+        assert second.data["next"] is None
+
+    def test_search_only_own_items(self, auth_client, user):
+        other = User.objects.create_user(
+            email="other@example.com", password="pass12345", first_name="O", last_name="U",
+        )
+        Item.objects.create(name="Phone", category="electronics", price="999", owner=other)
+
+        url = reverse("items:item-list")
+        response = auth_client.get(url, {"search": "phone"})
+
+        assert response.data["count"] == 0
+
+
 # ─── Analytics Tests ───────────────────────────────
 
 
@@ -203,3 +759,229 @@ class TestCategoryDensity:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["data"]["total"] == 0
         assert response.data["data"]["categories"] == []
+
+
+@pytest.mark.django_db
+class TestAnalyticsSummary:
+    url = reverse("items:item-summary")
+
+    @pytest.fixture
+    def items(self, user):
+        for price in ["10", "20", "30", "40", "100"]:
+            Item.objects.create(name=f"Book {price}", category="books", price=price, owner=user)
+        Item.objects.create(
+            name="Phone", category="electronics", price="50", status="inactive", owner=user
+        )
+        Item.objects.create(name="Gone", category="books", price="999", owner=user, is_deleted=True)
+
+    def test_summary(self, auth_client, items):
+        response = auth_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["total"] == 6
+        assert data["matrix"][0] == {
+            "category": "books",
+            "total": 5,
+            "statuses": {"active": 5, "inactive": 0, "archived": 0},
+        }
+        assert data["matrix"][1]["statuses"]["inactive"] == 1
+
+        books = data["price_stats"][0]
+        assert (books["min"], books["max"], books["avg"]) == (10.0, 100.0, 40.0)
+        assert books["p50"] == 30.0
+        assert books["p90"] == pytest.approx(76.0)
+
+    def test_histogram_buckets(self, auth_client, items):
+        response = auth_client.get(self.url, {"buckets": 3})
+
+        histogram = response.data["data"]["histogram"]
+        assert [bucket["count"] for bucket in histogram] == [3, 2, 1]
+        assert histogram[0]["lower"] == 10.0
+        assert histogram[-1]["upper"] == 100.0
+
+    def test_honours_filters(self, auth_client, items):
+        response = auth_client.get(self.url, {"status": "inactive"})
+
+        data = response.data["data"]
+        assert data["total"] == 1
+        assert data["price_stats"][0]["category"] == "electronics"
+        assert data["histogram"] == [{"lower": 50.0, "upper": 50.0, "count": 1}]
+
+    def test_single_query(self, auth_client, items, django_assert_max_num_queries):
+        # Auth user lookup, the change marker and the streamed item query.
+        with django_assert_max_num_queries(3):
+            auth_client.get(self.url)
+
+    def test_empty(self, auth_client):
+        response = auth_client.get(self.url)
+
+        assert response.data["data"] == {
+            "total": 0, "matrix": [], "price_stats": [], "histogram": []
+        }
+
+    def test_invalid_buckets(self, auth_client):
+        response = auth_client.get(self.url, {"buckets": 0})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# ─── Async View Tests ──────────────────────────────
+
+
+@pytest.mark.django_db
+class TestAsyncItemViews:
+    @pytest.fixture
+    def items(self, user):
+        for i, (category, price) in enumerate([("books", "10"), ("electronics", "25.5"), ("books", "7")]):
+            Item.objects.create(name=f"Item {i}", category=category, price=price, owner=user)
+
+    @pytest.mark.parametrize(
+        "name, params",
+        [
+            ("item-list", {}),
+            ("item-list", {"category": "books", "ordering": "price", "per_page": 1, "page": 2}),
+            ("item-list", {"cursor": "", "per_page": 2, "fields": "id,name"}),
+            ("item-category-density", {}),
+            ("item-summary", {"buckets": 4, "min_price": 8}),
+        ],
+    )
+    def test_matches_sync_endpoint(self, auth_client, items, name, params):
+        sync = auth_client.get(reverse(f"items:{name}"), params)
+        native = auth_client.get(reverse(f"async_items:{name}"), params)
+
+        assert native.status_code == sync.status_code == status.HTTP_200_OK
+        expected = json.loads(sync.content)
+        for link in ("next", "previous"):
+            if expected.get(link):
+                expected[link] = expected[link].replace("/api/items/", "/api/async/items/")
+        assert native.json() == expected
+
+    def test_retrieve(self, auth_client, sample_item):
+        url = reverse("async_items:item-detail", kwargs={"pk": sample_item.pk})
+
+        response = auth_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        detail = auth_client.get(reverse("items:item-detail", kwargs={"pk": sample_item.pk}))
+        assert response.json() == json.loads(detail.content)
+
+    def test_retrieve_other_users_item(self, auth_client, sample_item):
+        other = User.objects.create_user(username="other", email="o@example.com", password="x")
+        item = Item.objects.create(name="Theirs", category="books", price="1", owner=other)
+
+        response = auth_client.get(reverse("async_items:item-detail", kwargs={"pk": item.pk}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["error"] == "NOT_FOUND"
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(reverse("async_items:item-list"))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["success"] is False
+        assert response["WWW-Authenticate"].startswith("Bearer")
+
+    def test_invalid_token(self, api_client):
+        api_client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+
+        response = api_client.get(reverse("async_items:item-list"))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_invalid_page(self, auth_client, items):
+        response = auth_client.get(reverse("async_items:item-list"), {"page": 9})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_last_page(self, auth_client, items):
+        response = auth_client.get(reverse("async_items:item-list"), {"page": "last", "per_page": 2})
+
+        assert [item["name"] for item in response.json()["results"]] == ["Item 0"]
+
+    def test_read_only(self, auth_client):
+        response = auth_client.post(reverse("async_items:item-list"), {}, format="json")
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+
+# ─── Counter Tests ─────────────────────────────────
+
+
+@pytest.mark.django_db
+class TestItemCounters:
+    def _stored(self, user):
+        return {
+            (c.category, c.status): c.count
+            for c in ItemCounter.objects.filter(owner=user).exclude(count=0)
+        }
+
+    def test_api_writes_keep_counters_exact(self, auth_client, user, item_payload):
+        list_url = reverse("items:item-list")
+        bulk_url = reverse("items:item-bulk-create")
+        created = auth_client.post(list_url, item_payload).data
+        auth_client.post(list_url, {**item_payload, "category": "food"})
+        detail = reverse("items:item-detail", kwargs={"pk": created["id"]})
+        auth_client.put(detail, {**item_payload, "status": "archived"})
+        items = auth_client.post(
+            bulk_url,
+            [{"name": f"B{i}", "category": "other", "price": "1"} for i in range(3)],
+            format="json",
+        ).data["data"]["items"]
+        auth_client.patch(bulk_url, [{"id": items[0]["id"], "category": "food"}], format="json")
+        auth_client.delete(bulk_url, {"ids": [items[1]["id"]]}, format="json")
+        auth_client.delete(detail)
+        auth_client.post(
+            reverse("items:item-bulk-import"),
+            b"name,category,price\nImported,books,3\n",
+            content_type="text/csv",
+        )
+
+        assert self._stored(user) == {
+            ("food", "active"): 2,
+            ("other", "active"): 1,
+            ("books", "active"): 1,
+        }
+        assert counters.verify([user.pk]) == []
+
+    def test_orm_saves_keep_counters_exact(self, user):
+        item = Item.objects.create(name="A", category="books", price="1", owner=user)
+        item = Item.objects.get(pk=item.pk)
+        item.category = "food"
+        item.save()
+        Item.objects.create(name="B", category="food", price="1", owner=user, is_deleted=True)
+
+        assert self._stored(user) == {("food", "active"): 1}
+
+    def test_category_density_is_single_query(self, auth_client, sample_item):
+        url = reverse("items:item-category-density")
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.get(url)
+
+        item_queries = [q for q in ctx.captured_queries if '"items_item"' in q["sql"]]
+        counter_queries = [q for q in ctx.captured_queries if "items_itemcounter" in q["sql"]]
+        assert response.data["data"]["total"] == 1
+        assert len(counter_queries) == 1
+        assert all("MAX(" in q["sql"] for q in item_queries)
+
+    def test_pagination_reuses_counter_total(self, auth_client, user):
+        for category in ["books", "books", "food"]:
+            Item.objects.create(name="X", category=category, price="1", owner=user)
+        url = reverse("items:item-list")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = auth_client.get(url, {"category": "books"})
+
+        assert response.data["count"] == 2
+        assert not any("__count" in q["sql"] for q in ctx.captured_queries)
+        assert auth_client.get(url, {"min_price": 0}).data["count"] == 3
+
+    def test_rebuild_and_verify_command(self, user, sample_item):
+        ItemCounter.objects.filter(owner=user).update(count=7)
+
+        with pytest.raises(CommandError):
+            call_command("rebuild_item_counters", "--verify", stdout=io.StringIO())
+        call_command("rebuild_item_counters", stdout=io.StringIO())
+        call_command("rebuild_item_counters", "--verify", "--owner", str(user.pk), stdout=io.StringIO())
+
+        assert self._stored(user) == {("electronics", "active"): 1}
@@ -1,20 +1,105 @@
+import csv
+import hashlib
 import logging
+from collections.abc import Sequence
 
-from django.db.models import Count, QuerySet
+from django.db import transaction
+from django.db.models import Count, Max, QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
+from rest_framework import serializers
 from rest_framework.decorators import action
+from rest_framework.exceptions import UnsupportedMediaType
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from apps.core.db_router import ReplicaReadMixin
+from apps.core.exceptions import ValidationError
+from apps.core.renderers import CSVRenderer, NDJSONRenderer
+from apps.core.serializers import RowSerializer
+
+from . import counters
+from .cache import invalidate_owner, item_responses
 from .filters import ItemFilter
-from .models import Item
-from .serializers import CategoryDensitySerializer, ItemSerializer
+from .importers import (
+    CSV_CONTENT_TYPES,
+    NDJSON_CONTENT_TYPES,
+    import_items,
+    iter_csv_rows,
+    iter_lines,
+    iter_ndjson_rows,
+)
+from .models import Item, ItemCounter
+from .search import FullTextSearchFilter
+from .analytics import summarize
+from .serializers import (
+    AnalyticsSummaryQuerySerializer,
+    BulkDeleteSerializer,
+    CategoryDensitySerializer,
+    CategoryStatusSerializer,
+    HistogramBucketSerializer,
+    ItemSerializer,
+    PriceStatsSerializer,
+)
 
 logger = logging.getLogger(__name__)
 
+BULK_MAX_ITEMS = 5000
+EXPORT_CHUNK_SIZE = 2000
+ANALYTICS_CHUNK_SIZE = 5000
+
 
-class ItemViewSet(viewsets.ModelViewSet):
+def _change_marker(request: Request) -> dict:
+    """
+    Cheap per-owner change marker: newest ``updated_at`` and row count over
+    all of the owner's items (soft-deleted included, since soft-delete bumps
+    ``updated_at``). Served from idx_item_owner_updated; computed once per request.
+    """
+    if not hasattr(request, "_item_change_marker"):
+        request._item_change_marker = Item.objects.filter(owner=request.user).aggregate(
+            last_modified=Max("updated_at"), rows=Count("pk")
+        )
+    return request._item_change_marker
+
+
+def _etag(request: Request, *args, **kwargs) -> str:
+    marker = _change_marker(request)
+    last_modified = marker["last_modified"]
+    key = "|".join([
+        str(request.user.pk),
+        last_modified.isoformat() if last_modified else "",
+        str(marker["rows"]),
+        request.get_full_path(),
+        request.accepted_media_type or "",
+    ])
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _last_modified(request: Request, *args, **kwargs):
+    return _change_marker(request)["last_modified"]
+
+
+def conditional_on_items(view):
+    """ETag/Last-Modified from the owner's change marker; 304 skips the query and serializer."""
+    view = condition(etag_func=_etag, last_modified_func=_last_modified)(view)
+    return vary_on_headers("Authorization")(view)
+
+
+def cached_item_read(view):
+    """Serve from the owner-versioned response cache, falling back to the conditional view."""
+    return item_responses.cache_per_owner(conditional_on_items(view))
+
+
+@method_decorator(cached_item_read, name="list")
+@method_decorator(cached_item_read, name="retrieve")
+class ItemViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     ViewSet for Item CRUD operations.
 
@@ -23,63 +108,279 @@ class ItemViewSet(viewsets.ModelViewSet):
     read:   GET    /api/items/{id}/
     update: PUT    /api/items/{id}/
     delete: DELETE /api/items/{id}/ (soft delete)
+
+    bulk create:  POST   /api/items/bulk/  [{...}, ...]
+    bulk update:  PATCH  /api/items/bulk/  [{"id": 1, ...}, ...]
+    bulk delete:  DELETE /api/items/bulk/  {"ids": [1, 2, ...]}
+    export:       GET    /api/items/export/?format=ndjson|csv
+    import:       POST   /api/items/import/  (text/csv or application/x-ndjson body)
     """
 
     serializer_class = ItemSerializer
     permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = ItemFilter
     search_fields = ["name", "description"]
     ordering_fields = ["created_at", "name", "price"]
     ordering = ["-created_at"]
+    # Query parameters that do not narrow the result set beyond what the
+    # per-owner counters can answer (see get_pagination_count).
+    counter_params = {"page", "per_page", "ordering", "format", "category", "status", "fields"}
 
     def get_queryset(self) -> QuerySet:
         """Return non-deleted items owned by the authenticated user."""
-        return Item.objects.filter(
+        queryset = Item.objects.filter(
             is_deleted=False,
             owner=self.request.user,
         ).select_related("owner")
+        if self.action in ("update", "partial_update", "destroy"):
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset
+
+    def get_pagination_count(self) -> int | None:
+        """Serve the page-number total from the counters when only category/status filter."""
+        params = self.request.query_params
+        if not set(params) <= self.counter_params:
+            return None
+        return counters.counts(
+            self.request.user.pk, category=params.get("category"), status=params.get("status")
+        )
+
+    async def aget_pagination_count(self) -> int | None:
+        """Async ORM variant of :meth:`get_pagination_count`."""
+        params = self.request.query_params
+        if not set(params) <= self.counter_params:
+            return None
+        return await counters.acounts(
+            self.request.user.pk, category=params.get("category"), status=params.get("status")
+        )
+
+    def get_row_serializer(self) -> RowSerializer:
+        """Fast read-path serializer honouring ``?fields=`` sparse fieldsets."""
+        return RowSerializer.from_query_param(
+            ItemSerializer,
+            self.request.query_params.get("fields"),
+            constants={"owner": str(self.request.user)},
+        )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        List items from ``.values()`` rows instead of model instances.
+
+        Only the requested columns (plus the ordering keys the cursor needs)
+        are selected, and the owner is always the requester, so no join.
+        """
+        row_serializer = self.get_row_serializer()
+        queryset = self.get_list_queryset(row_serializer)
+
+        page = self.paginate_queryset(queryset)
+        rows = queryset if page is None else page
+        data = [row_serializer.to_representation(row) for row in rows]
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
+
+    def get_list_queryset(self, row_serializer: RowSerializer) -> QuerySet:
+        """Filtered ``.values()`` queryset with the row columns plus the ordering keys."""
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = queryset.query.order_by or Item._meta.ordering
+        keys = {field.lstrip("-") for field in ordering} - {"pk"}
+        columns = list(dict.fromkeys([*row_serializer.columns, *keys, "id"]))
+        return queryset.values(*columns)
 
     def perform_create(self, serializer) -> None:
         """Assign the authenticated user as the item owner on creation."""
         serializer.save(owner=self.request.user)
-        logger.info(
+        logger.debug(
             "Item created: '%s' by %s",
             serializer.instance.name,
             self.request.user.email,
         )
 
+    @transaction.atomic
+    def update(self, request: Request, *args, **kwargs) -> Response:
+        """Update under a row lock so concurrent category/status changes keep counters exact."""
+        return super().update(request, *args, **kwargs)
+
+    @transaction.atomic
     def destroy(self, request: Request, *args, **kwargs) -> Response:
         """Soft-delete an item by setting is_deleted=True."""
         instance = self.get_object()
         instance.is_deleted = True
         instance.save(update_fields=["is_deleted", "updated_at"])
-        logger.info(
+        logger.debug(
             "Item soft-deleted: id=%s by %s", instance.pk, request.user.email
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    @transaction.atomic
+    def bulk_create(self, request: Request) -> Response:
+        """Validate and insert up to BULK_MAX_ITEMS items in one batch."""
+        serializer = self._get_bulk_serializer(data=request.data)
+        items = serializer.save(owner=request.user)
+        ItemCounter.objects.apply_moves(request.user.pk, [(None, i.counter_key) for i in items])
+        invalidate_owner(request.user.pk)
+        logger.info("Items bulk-created: %d by %s", len(items), request.user.email)
+        return Response(
+            {"success": True, "data": {"created": len(items), "items": serializer.data}},
+            status=status.HTTP_201_CREATED,
+        )
+
+    @bulk_create.mapping.patch
+    @transaction.atomic
+    def bulk_update(self, request: Request) -> Response:
+        """Partially update up to BULK_MAX_ITEMS items, each row identified by ``id``."""
+        rows = request.data[: BULK_MAX_ITEMS + 1] if isinstance(request.data, list) else []
+        ids = {row.get("id") for row in rows if isinstance(row, dict)}
+        instances = (
+            self.get_queryset()
+            .select_for_update(of=("self",))
+            .in_bulk([pk for pk in ids if str(pk).isdigit()])
+        )
+
+        serializer = self._get_bulk_serializer(instances, data=request.data, partial=True)
+        before = {pk: item.counter_key for pk, item in instances.items()}
+        items = serializer.save()
+        ItemCounter.objects.apply_moves(
+            request.user.pk, [(before[item.pk], item.counter_key) for item in items]
+        )
+        invalidate_owner(request.user.pk)
+        logger.info("Items bulk-updated: %d by %s", len(items), request.user.email)
+        return Response(
+            {"success": True, "data": {"updated": len(items), "items": serializer.data}}
+        )
+
+    @bulk_create.mapping.delete
+    @transaction.atomic
+    def bulk_destroy(self, request: Request) -> Response:
+        """Soft-delete the given item ids with a single UPDATE; unknown ids are reported."""
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = set(serializer.validated_data["ids"])
+        if len(ids) > BULK_MAX_ITEMS:
+            raise ValidationError(f"At most {BULK_MAX_ITEMS} items per request.")
+
+        queryset = self.get_queryset().filter(pk__in=ids)
+        rows = list(
+            queryset.select_for_update(of=("self",)).values_list("pk", "category", "status")
+        )
+        found = {pk for pk, _, _ in rows}
+        deleted = queryset.filter(pk__in=found).update(
+            is_deleted=True, updated_at=timezone.now()
+        )
+        ItemCounter.objects.apply_moves(request.user.pk, [((c, s), None) for _, c, s in rows])
+        invalidate_owner(request.user.pk)
+        logger.info("Items bulk-deleted: %d by %s", deleted, request.user.email)
+        return Response(
+            {
+                "success": True,
+                "data": {"deleted": deleted, "not_found": sorted(ids - found)},
+            }
+        )
+
+    def _get_bulk_serializer(self, *args, **kwargs) -> ItemSerializer:
+        """Validate a whole batch, turning per-row failures into one indexed error list."""
+        serializer = self.get_serializer(
+            *args, many=True, allow_empty=False, max_length=BULK_MAX_ITEMS, **kwargs
+        )
+        try:
+            serializer.is_valid(raise_exception=True)
+        except serializers.ValidationError as exc:
+            if not isinstance(exc.detail, list):
+                raise
+            rows = [
+                {"index": index, "errors": errors}
+                for index, errors in enumerate(exc.detail)
+                if errors
+            ]
+            raise ValidationError(
+                message=f"{len(rows)} of {len(exc.detail)} rows failed validation.",
+                details={"rows": rows},
+            )
+        return serializer
+
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[NDJSONRenderer, CSVRenderer],
+        pagination_class=None,
+    )
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """
+        Stream every matching item as NDJSON or CSV.
+
+        Takes the same filter, search and ordering parameters as the list
+        endpoint. Rows are read with a chunked iterator (a server-side cursor
+        on PostgreSQL) and written as they arrive, so memory stays flat.
+        """
+        renderer = request.accepted_renderer
+        row_serializer = self.get_row_serializer()
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self._export_rows(queryset, row_serializer)
+
+        response = StreamingHttpResponse(
+            renderer.stream(row_serializer.fields, rows),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        filename = f"items-{timezone.now():%Y%m%d%H%M%S}.{renderer.format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @staticmethod
+    def _export_rows(queryset: QuerySet, row_serializer: RowSerializer):
+        """Yield rendered value lists straight from the cursor."""
+        rows = queryset.values(*row_serializer.columns).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        for row in rows:
+            yield list(row_serializer.to_representation(row).values())
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[])
+    def bulk_import(self, request: Request) -> Response:
+        """
+        Import a CSV or NDJSON upload, parsing the body incrementally.
+
+        Rows are validated with ItemSerializer's rules in batches and
+        inserted with COPY (PostgreSQL) or bulk_create. The response reports
+        accepted/rejected counts and per-line errors.
+        """
+        content_type = request.content_type.split(";")[0].strip().lower()
+        if content_type in CSV_CONTENT_TYPES:
+            records = iter_csv_rows(iter_lines(request.stream))
+        elif content_type in NDJSON_CONTENT_TYPES:
+            records = iter_ndjson_rows(iter_lines(request.stream))
+        else:
+            raise UnsupportedMediaType(content_type)
+
+        try:
+            result = import_items(records, owner_id=request.user.pk)
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise ValidationError(f"Upload could not be parsed: {exc}")
+        finally:
+            invalidate_owner(request.user.pk)
+        logger.info(
+            "Items imported: %d accepted, %d rejected by %s",
+            result.accepted,
+            result.rejected,
+            request.user.email,
+        )
+        return Response({"success": True, "data": result.as_dict()})
+
     @action(detail=False, methods=["get"], url_path="analytics/category-density")
+    @method_decorator(cached_item_read)
     def category_density(self, request: Request) -> Response:
         """
         Return item count and percentage distribution per category.
 
+        Served from the per-owner counters in a single indexed query.
+
         Response: {success, data: {total, categories: [{category, count, percentage}]}}
         """
-        queryset = self.get_queryset()
-        total = queryset.count()
-
-        if total == 0:
-            return Response(
-                {"success": True, "data": {"total": 0, "categories": []}}
-            )
-
-        categories = (
-            queryset
-            .values("category")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-        )
+        categories = counters.category_counts(request.user.pk)
+        total = sum(item["count"] for item in categories)
+        return Response({"success": True, "data": self.category_density_data(categories, total)})
 
+    @staticmethod
+    def category_density_data(categories: Sequence[dict], total: int) -> dict:
         result = [
             {
                 "category": item["category"],
@@ -88,11 +389,44 @@ class ItemViewSet(viewsets.ModelViewSet):
             }
             for item in categories
         ]
+        return {
+            "total": total,
+            "categories": CategoryDensitySerializer(result, many=True).data,
+        }
+
+    @action(detail=False, methods=["get"], url_path="analytics/summary")
+    @method_decorator(cached_item_read)
+    def summary(self, request: Request) -> Response:
+        """
+        Category × status matrix, per-category price statistics and a price
+        histogram (``?buckets=``, default 10) for the filtered items.
+
+        Honours the list filters and is computed from one price-ordered
+        query streamed in chunks; see :mod:`apps.items.analytics`.
+        """
+        buckets = self.get_summary_buckets()
+        rows = self.get_summary_queryset().iterator(chunk_size=ANALYTICS_CHUNK_SIZE)
+        result = summarize(rows, buckets=buckets)
+        return Response({"success": True, "data": self.summary_data(result)})
+
+    def get_summary_buckets(self) -> int:
+        params = AnalyticsSummaryQuerySerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        return params.validated_data["buckets"]
+
+    def get_summary_queryset(self) -> QuerySet:
+        """Filtered ``(category, status, price)`` rows in price order (idx_item_owner_price)."""
+        return (
+            self.filter_queryset(self.get_queryset())
+            .order_by("price", "id")
+            .values_list("category", "status", "price")
+        )
 
-        return Response({
-            "success": True,
-            "data": {
-                "total": total,
-                "categories": CategoryDensitySerializer(result, many=True).data,
-            },
-        })
+    @staticmethod
+    def summary_data(result: dict) -> dict:
+        return {
+            "total": result["total"],
+            "matrix": CategoryStatusSerializer(result["matrix"], many=True).data,
+            "price_stats": PriceStatsSerializer(result["price_stats"], many=True).data,
+            "histogram": HistogramBucketSerializer(result["histogram"], many=True).data,
+        }
@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
+
+    def ready(self):
+        user_model = self.get_model("User")
+        post_save.connect(_invalidate_cached_user, sender=user_model)
+        post_delete.connect(_invalidate_cached_user, sender=user_model)
+
+
+def _invalidate_cached_user(sender, instance, **kwargs):
+    from .authentication import invalidate_user
+
+    invalidate_user(instance.pk)
@@ -0,0 +1,120 @@
+import copy
+import time
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.core.cache import TTLCache
+
+# Per-process caches used by CachedJWTAuthentication: raw token -> validated
+# token, and str(user id) -> user row.
+token_cache = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL)
+user_cache = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL)
+
+
+def invalidate_user(user_id) -> None:
+    """Drop a cached user row so the next request re-reads it."""
+    user_cache.pop(str(user_id))
+
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication with an ``aauthenticate()`` coroutine for async views.
+
+    Header parsing and token validation are pure CPU work and reused as-is;
+    only the user lookup goes through the async ORM.
+    """
+
+    async def aauthenticate(self, request) -> tuple | None:
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token: Token):
+        """Async ORM variant of ``JWTAuthentication.get_user``."""
+        user = await self.afetch_user(self.get_user_id(validated_token))
+        self.check_user(user, validated_token)
+        return user
+
+    def get_user_id(self, validated_token: Token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from exc
+
+    def fetch_user(self, user_id):
+        try:
+            return self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as exc:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from exc
+
+    async def afetch_user(self, user_id):
+        try:
+            return await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as exc:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from exc
+
+    def check_user(self, user, validated_token: Token) -> None:
+        """The active and password-revocation checks of ``JWTAuthentication.get_user``."""
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+
+
+class CachedJWTAuthentication(AsyncJWTAuthentication):
+    """
+    JWT authentication that runs no queries in steady state.
+
+    Decoded tokens are cached by their raw bytes until the sooner of the
+    cache TTL and the token's own expiry, so a signature is verified once per
+    process. User rows are cached by id; saving or deleting a user evicts
+    its row in this process (see ``UsersConfig.ready``), and other workers
+    pick the change up within ``AUTH_CACHE_TTL`` seconds. Active and
+    revocation checks still run on every request against the cached row.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        validated_token = token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            expires_in = validated_token.get("exp", 0) - time.time()
+            token_cache.set(raw_token, validated_token, ttl=expires_in)
+        return validated_token
+
+    def get_user(self, validated_token: Token):
+        user_id = self.get_user_id(validated_token)
+        user = user_cache.get(str(user_id))
+        if user is None:
+            user = self.fetch_user(user_id)
+            user_cache.set(str(user_id), user)
+        self.check_user(user, validated_token)
+        # Views may modify request.user (ProfileView saves it), so never hand
+        # out the shared instance.
+        return copy.copy(user)
+
+    async def aget_user(self, validated_token: Token):
+        user_id = self.get_user_id(validated_token)
+        user = user_cache.get(str(user_id))
+        if user is None:
+            user = await self.afetch_user(user_id)
+            user_cache.set(str(user_id), user)
+        self.check_user(user, validated_token)
+        return copy.copy(user)
@@ -0,0 +1,179 @@
+"""
+Refresh-token blacklist with an in-memory membership test.
+
+Each process keeps every unexpired revoked JTI in a compact expiring set
+fronted by a Bloom filter, so the usual "not revoked" answer never touches
+the database. Revocations are buffered and written with ``bulk_create`` in
+batches; every ``TOKEN_BLACKLIST_SYNC_INTERVAL`` seconds a process flushes
+its buffer and loads the JTIs other workers revoked since its last sync.
+A token rotated in one worker is therefore refused by the others within
+about two sync intervals. Expired entries are pruned from memory and from
+the ``RevokedToken`` table every ``TOKEN_BLACKLIST_PRUNE_INTERVAL`` seconds.
+"""
+
+import atexit
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte strings; false positives only, no deletes."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: bytes):
+        digest = hashlib.blake2b(value, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: bytes) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: bytes) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(value))
+
+
+def _key(jti: str) -> bytes:
+    """simplejwt JTIs are uuid4 hex; store them as 16 raw bytes."""
+    try:
+        return bytes.fromhex(jti)
+    except ValueError:
+        return jti.encode()
+
+
+class TokenBlacklist:
+    """Revoked JTIs of one process: Bloom filter, expiring set and write buffer."""
+
+    def __init__(
+        self,
+        capacity: int,
+        batch_size: int,
+        sync_interval: float,
+        prune_interval: float,
+        timer=time.monotonic,
+    ):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self.prune_interval = prune_interval
+        self.timer = timer
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all in-memory state; the next check reloads from the database."""
+        with self._lock:
+            self._revoked: dict[bytes, int] = {}
+            self._bloom = BloomFilter(self.capacity)
+            self._pending: list[tuple[str, int]] = []
+            self._synced_at = None
+            self._synced_since = None
+            self._pruned_at = self.timer()
+
+    def is_revoked(self, jti: str) -> bool:
+        self._maybe_sync()
+        key = _key(jti)
+        if key not in self._bloom:
+            return False
+        exp = self._revoked.get(key)
+        return exp is not None and exp > time.time()
+
+    def revoke(self, jti: str, exp: int) -> None:
+        """Blacklist ``jti`` until ``exp`` (epoch seconds); persisted with the next batch."""
+        with self._lock:
+            self._add(jti, exp)
+            self._pending.append((jti, exp))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+        else:
+            self._maybe_sync()
+
+    def flush(self) -> None:
+        """Write buffered revocations in one ``bulk_create``."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+            try:
+                RevokedToken.objects.bulk_create(
+                    [
+                        RevokedToken(jti=jti, expires_at=datetime_from_epoch(exp))
+                        for jti, exp in pending
+                    ],
+                    ignore_conflicts=True,
+                )
+            except DatabaseError:
+                # Still revoked in this process; retry with the next batch.
+                logger.exception("Could not persist %d token revocations", len(pending))
+                self._pending[:0] = pending
+
+    def sync(self) -> None:
+        """Flush, then load JTIs revoked by any process since the previous sync."""
+        with self._lock:
+            self.flush()
+            now = timezone.now()
+            rows = RevokedToken.objects.filter(expires_at__gt=now)
+            if self._synced_since is not None:
+                # Overlap one interval so rows committed late are not missed.
+                rows = rows.filter(created_at__gte=self._synced_since)
+            for jti, expires_at in rows.values_list("jti", "expires_at").iterator():
+                self._add(jti, int(expires_at.timestamp()))
+            self._synced_since = now - timedelta(seconds=self.sync_interval)
+            self._synced_at = self.timer()
+
+            if self._synced_at - self._pruned_at >= self.prune_interval:
+                self.prune()
+
+    def prune(self) -> None:
+        """Drop expired JTIs from memory and the database and rebuild the Bloom filter."""
+        with self._lock:
+            now = time.time()
+            self._revoked = {key: exp for key, exp in self._revoked.items() if exp > now}
+            self._bloom = BloomFilter(max(self.capacity, 2 * len(self._revoked)))
+            for key in self._revoked:
+                self._bloom.add(key)
+            RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+            self._pruned_at = self.timer()
+
+    def _add(self, jti: str, exp: int) -> None:
+        key = _key(jti)
+        self._bloom.add(key)
+        self._revoked[key] = exp
+
+    def _maybe_sync(self) -> None:
+        if self._synced_at is None or self.timer() - self._synced_at >= self.sync_interval:
+            with self._lock:
+                if self._synced_at is None or self.timer() - self._synced_at >= self.sync_interval:
+                    self.sync()
+
+
+blacklist = TokenBlacklist(
+    capacity=settings.TOKEN_BLACKLIST_CAPACITY,
+    batch_size=settings.TOKEN_BLACKLIST_BATCH_SIZE,
+    sync_interval=settings.TOKEN_BLACKLIST_SYNC_INTERVAL,
+    prune_interval=settings.TOKEN_BLACKLIST_PRUNE_INTERVAL,
+)
+
+
+atexit.register(blacklist.flush)
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.items.importers import iter_csv_rows
+from apps.users.provisioning import Provisioner, init_worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Create users from a CSV file with email, first_name, last_name and an optional "
+        "password column. Use '-' to read from stdin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import, or '-' for stdin.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Password-hashing processes (default: CPU count). 0 hashes in this process.",
+        )
+        parser.add_argument(
+            "--tokens-file",
+            help="Write email, access and refresh tokens of the created users to this CSV file.",
+        )
+
+    def handle(self, *args, path, workers=0, tokens_file=None, **options):
+        started = time.monotonic()
+        with ExitStack() as stack:
+            if path == "-":
+                source = sys.stdin
+            else:
+                try:
+                    source = stack.enter_context(open(path, newline="", encoding="utf-8-sig"))
+                except OSError as exc:
+                    raise CommandError(f"Cannot read {path}: {exc}")
+            tokens = None
+            if tokens_file:
+                tokens = stack.enter_context(open(tokens_file, "w", newline=""))
+            executor = None
+            if workers > 0:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+                )
+
+            result = Provisioner(executor=executor, tokens_file=tokens).run(iter_csv_rows(source))
+
+        for error in sorted(result.errors, key=lambda error: error["line"]):
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        if result.rejected > len(result.errors):
+            self.stderr.write(f"... {result.rejected - len(result.errors)} more rejected row(s)")
+
+        elapsed = time.monotonic() - started
+        message = (
+            f"Created {result.accepted} user(s), rejected {result.rejected} "
+            f"in {elapsed:.1f}s ({result.accepted / max(elapsed, 1e-9):.0f} users/s)."
+        )
+        style = self.style.WARNING if result.rejected else self.style.SUCCESS
+        self.stdout.write(style(message))
@@ -45,3 +45,19 @@ class User(AbstractUser):
 
     def __str__(self) -> str:
         return self.email
+
+
+class RevokedToken(models.Model):
+    """
+    A revoked refresh-token JTI, kept until the token would have expired.
+
+    Written in batches and read back into memory by
+    :mod:`apps.users.blacklist`; requests never query this table directly.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return self.jti
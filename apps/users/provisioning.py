@@ -0,0 +1,140 @@
+"""
+Bulk user provisioning behind ``manage.py import_users``.
+
+Rows are validated and de-duplicated a batch at a time, passwords are hashed
+in a process pool (PBKDF2 dominates the cost of ``create_user``), and each
+batch is written with one ``bulk_create`` in its own transaction.
+"""
+
+import csv
+from collections.abc import Iterable
+from concurrent.futures import Executor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from rest_framework import serializers
+
+from apps.items.importers import ImportResult
+
+from .models import User
+from .tokens import RefreshToken
+
+PROVISION_BATCH_SIZE = 1000
+TOKEN_COLUMNS = ["email", "access", "refresh"]
+
+
+class ProvisionSerializer(serializers.Serializer):
+    """RegisterSerializer's field rules, minus the per-row uniqueness query."""
+
+    email = serializers.EmailField()
+    first_name = serializers.CharField(max_length=50)
+    last_name = serializers.CharField(max_length=50)
+    password = serializers.CharField(min_length=8, required=False, allow_blank=True)
+
+    def validate_email(self, value: str) -> str:
+        return User.objects.normalize_email(value)
+
+
+def init_worker() -> None:
+    """Process-pool initializer; a no-op after fork, needed under spawn."""
+    django.setup()
+
+
+class Provisioner:
+    """
+    Create users from ``(line_number, row)`` records.
+
+    A row without a password gets an unusable one (the user sets it through
+    a reset). Emails and the usernames ``UserManager.create_user`` derives
+    from them must be new, in the file and in the database; clashing rows
+    are rejected with their line number.
+    """
+
+    def __init__(self, executor: Executor = None, tokens_file=None):
+        self.executor = executor
+        self.tokens = csv.writer(tokens_file) if tokens_file is not None else None
+        if self.tokens is not None:
+            self.tokens.writerow(TOKEN_COLUMNS)
+        self.result = ImportResult()
+        self.emails = set()
+        self.usernames = set()
+
+    def run(self, records: Iterable[tuple[int, dict | None]]) -> ImportResult:
+        batch = []
+        for line, row in records:
+            if row is None:
+                self.result.reject(line, {"non_field_errors": ["Malformed row."]})
+                continue
+            batch.append((line, row))
+            if len(batch) >= PROVISION_BATCH_SIZE:
+                self.flush(batch)
+                batch = []
+        if batch:
+            self.flush(batch)
+        return self.result
+
+    def flush(self, batch: list[tuple[int, dict]]) -> None:
+        candidates = []
+        for line, row in batch:
+            serializer = ProvisionSerializer(data=row)
+            if not serializer.is_valid():
+                self.result.reject(line, serializer.errors)
+                continue
+            data = serializer.validated_data
+            data["username"] = data["email"].split("@")[0]
+            candidates.append((line, data))
+
+        existing_emails, existing_usernames = self.existing(candidates)
+        accepted = []
+        for line, data in candidates:
+            if data["email"] in self.emails or data["email"] in existing_emails:
+                self.result.reject(line, {"email": ["A user with this email already exists."]})
+            elif data["username"] in self.usernames or data["username"] in existing_usernames:
+                self.result.reject(line, {"email": ["A user with this username already exists."]})
+            else:
+                self.emails.add(data["email"])
+                self.usernames.add(data["username"])
+                accepted.append(data)
+        if not accepted:
+            return
+
+        passwords = [data.pop("password", "") or None for data in accepted]
+        users = [
+            User(password=password, **data)
+            for data, password in zip(accepted, self.hash_passwords(passwords))
+        ]
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+        self.result.accepted += len(users)
+        if self.tokens is not None:
+            self.write_tokens(users)
+
+    @staticmethod
+    def existing(candidates: list[tuple[int, dict]]) -> tuple[set, set]:
+        emails = [data["email"] for _, data in candidates]
+        usernames = [data["username"] for _, data in candidates]
+        return (
+            set(User.objects.filter(email__in=emails).values_list("email", flat=True)),
+            set(User.objects.filter(username__in=usernames).values_list("username", flat=True)),
+        )
+
+    def hash_passwords(self, passwords: list[str | None]) -> list[str]:
+        """``make_password`` for each entry; None yields an unusable password."""
+        if self.executor is None:
+            return [make_password(password) for password in passwords]
+        return list(self.executor.map(make_password, passwords, chunksize=16))
+
+    def write_tokens(self, users: list[User]) -> None:
+        if any(user.pk is None for user in users):
+            # Backends that cannot return ids from a bulk insert.
+            ids = dict(
+                User.objects.filter(email__in=[user.email for user in users]).values_list(
+                    "email", "pk"
+                )
+            )
+            for user in users:
+                user.pk = ids[user.email]
+        for user in users:
+            refresh = RefreshToken.for_user(user)
+            self.tokens.writerow([user.email, str(refresh.access_token), str(refresh)])
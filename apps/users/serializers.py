@@ -1,6 +1,10 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import (
+    TokenRefreshSerializer as BaseTokenRefreshSerializer,
+)
 
 from .models import User
+from .tokens import RefreshToken
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -66,3 +70,9 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
         if not value.strip():
             raise serializers.ValidationError("Last name is required.")
         return value.strip()
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """Token refresh that rotates against the in-memory blacklist (``apps.users.tokens``)."""
+
+    token_class = RefreshToken
@@ -1,6 +1,17 @@
+import io
+
 import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.core.cache import TTLCache
+from apps.users import authentication
+from apps.users.blacklist import BloomFilter, TokenBlacklist
+from apps.users.models import RevokedToken, User
 
 
 REGISTER_URL = reverse("users:register")
@@ -169,3 +180,203 @@ class TestTokenRefresh:
         response = api_client.post(REFRESH_URL, {"refresh": "invalid-token"})
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_rotated_refresh_token_is_revoked(self, api_client, user):
+        login_response = api_client.post(
+            LOGIN_URL, {"email": "test@example.com", "password": "testpass123"}
+        )
+        refresh_token = login_response.data["data"]["tokens"]["refresh"]
+
+        first = api_client.post(REFRESH_URL, {"refresh": refresh_token})
+        replay = api_client.post(REFRESH_URL, {"refresh": refresh_token})
+        rotated = api_client.post(REFRESH_URL, {"refresh": first.data["refresh"]})
+
+        assert first.status_code == status.HTTP_200_OK
+        assert replay.status_code == status.HTTP_401_UNAUTHORIZED
+        assert rotated.status_code == status.HTTP_200_OK
+
+
+# ─── Token Blacklist Tests ────────────────────────
+
+
+@pytest.mark.django_db
+class TestTokenBlacklist:
+    @pytest.fixture
+    def clock(self):
+        return [0.0]
+
+    @pytest.fixture
+    def store(self, clock):
+        return TokenBlacklist(
+            capacity=100, batch_size=3, sync_interval=5, prune_interval=60, timer=lambda: clock[0]
+        )
+
+    def test_revocations_are_written_in_batches(self, store, django_assert_num_queries):
+        store.sync()
+        with django_assert_num_queries(0):
+            store.revoke("a" * 32, exp=2**31)
+            store.revoke("b" * 32, exp=2**31)
+        with django_assert_num_queries(1):
+            store.revoke("c" * 32, exp=2**31)
+
+        assert RevokedToken.objects.count() == 3
+
+    def test_unrevoked_lookup_stays_in_memory(self, store, django_assert_num_queries):
+        store.sync()
+
+        with django_assert_num_queries(0):
+            assert store.is_revoked("d" * 32) is False
+
+    def test_sync_loads_other_processes_revocations(self, store, clock):
+        other = TokenBlacklist(capacity=100, batch_size=1, sync_interval=5, prune_interval=60)
+        store.sync()
+        other.revoke("e" * 32, exp=2**31)
+
+        assert store.is_revoked("e" * 32) is False
+        clock[0] = 5
+        assert store.is_revoked("e" * 32) is True
+
+    def test_expired_entries_are_pruned(self, store, clock):
+        store.revoke("f" * 32, exp=1)
+        store.flush()
+
+        assert store.is_revoked("f" * 32) is False
+        clock[0] = 60
+        store.sync()
+        assert not RevokedToken.objects.exists()
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000)
+        keys = [str(i).encode() for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        assert sum(str(i).encode() in bloom for i in range(1000, 11000)) < 100
+
+
+# ─── Cached Authentication Tests ──────────────────
+
+
+@pytest.mark.django_db
+class TestCachedAuthentication:
+    def test_steady_state_runs_no_auth_queries(self, auth_client, django_assert_num_queries):
+        auth_client.get(PROFILE_URL)
+
+        with django_assert_num_queries(0):
+            response = auth_client.get(PROFILE_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_profile_update_invalidates_cached_user(self, auth_client):
+        auth_client.get(PROFILE_URL)
+        auth_client.put(PROFILE_URL, {"first_name": "Updated", "last_name": "Name"})
+
+        response = auth_client.get(PROFILE_URL)
+
+        assert response.data["first_name"] == "Updated"
+
+    def test_deactivation_invalidates_cached_user(self, auth_client, user):
+        auth_client.get(PROFILE_URL)
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+
+        response = auth_client.get(PROFILE_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_cached_user_is_not_shared_between_requests(self, auth_client, user):
+        auth_client.get(PROFILE_URL)
+        cached = authentication.user_cache.get(str(user.pk))
+
+        response = auth_client.get(PROFILE_URL)
+
+        assert response.wsgi_request.user is not cached
+
+
+class TestTTLCache:
+    def test_entries_expire(self):
+        now = [0.0]
+        cache = TTLCache(maxsize=10, ttl=5, timer=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1)
+
+        now[0] = 2
+        assert (cache.get("a"), cache.get("b")) == (1, None)
+        now[0] = 5
+        assert cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+# ─── Bulk Provisioning Tests ──────────────────────
+
+
+@pytest.mark.django_db
+class TestImportUsers:
+    @pytest.fixture(autouse=True)
+    def fast_hasher(self, settings):
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    @pytest.fixture
+    def users_csv(self, tmp_path, user):
+        path = tmp_path / "users.csv"
+        path.write_text(
+            "email,first_name,last_name,password\n"
+            "ada@example.com,Ada,Lovelace,analytical1\n"
+            "alan@Example.COM,Alan,Turing,\n"
+            "test@example.com,Dup,Existing,password123\n"
+            "ada@example.com,Dup,InFile,password123\n"
+            "not-an-email,Bad,Email,password123\n"
+            "grace@example.com,Grace,Hopper,short\n"
+        )
+        return path
+
+    def run(self, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command("import_users", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_creates_valid_users_and_reports_rejects(self, users_csv):
+        stdout, stderr = self.run(str(users_csv), "--workers", "0")
+
+        assert "Created 2 user(s), rejected 4" in stdout
+        assert [line.split(":")[0] for line in stderr.splitlines()] == [
+            "line 4", "line 5", "line 6", "line 7",
+        ]
+        ada = User.objects.get(email="ada@example.com")
+        assert ada.username == "ada" and ada.check_password("analytical1")
+        assert not User.objects.get(email="alan@example.com").has_usable_password()
+
+    def test_hashes_in_process_pool(self, users_csv):
+        self.run(str(users_csv), "--workers", "2")
+
+        assert User.objects.get(email="ada@example.com").check_password("analytical1")
+
+    def test_writes_tokens_file(self, users_csv, tmp_path):
+        tokens_path = tmp_path / "tokens.csv"
+
+        self.run(str(users_csv), "--workers", "0", "--tokens-file", str(tokens_path))
+
+        header, *rows = [line.split(",") for line in tokens_path.read_text().splitlines()]
+        assert header == ["email", "access", "refresh"]
+        assert [row[0] for row in rows] == ["ada@example.com", "alan@example.com"]
+        ada = User.objects.get(email="ada@example.com")
+        assert AccessToken(rows[0][1])["user_id"] == str(ada.pk)
+
+    def test_accepted_rows_are_inserted_in_one_statement(self, users_csv, monkeypatch):
+        monkeypatch.setattr("apps.users.provisioning.PROVISION_BATCH_SIZE", 3)
+
+        with CaptureQueriesContext(connection) as context:
+            self.run(str(users_csv), "--workers", "0")
+
+        inserts = [q["sql"] for q in context.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+        assert User.objects.count() == 3
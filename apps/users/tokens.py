@@ -0,0 +1,29 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+from .blacklist import blacklist
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token checked against :data:`apps.users.blacklist.blacklist`.
+
+    Replaces ``rest_framework_simplejwt.token_blacklist``: verifying is an
+    in-memory lookup and blacklisting joins the next batched insert.
+    """
+
+    def verify(self, *args, **kwargs) -> None:
+        super().verify(*args, **kwargs)
+        self.check_blacklist()
+
+    def check_blacklist(self) -> None:
+        if blacklist.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> None:
+        blacklist.revoke(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+
+    def outstand(self) -> None:
+        """Outstanding tokens are not tracked; only revocations are stored."""
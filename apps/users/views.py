@@ -6,7 +6,9 @@ from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.core.db_router import ReplicaReadMixin
+from apps.core.throttling import LoginRateThrottle, RegisterRateThrottle
 
 from .models import User
 from .serializers import (
@@ -15,6 +17,7 @@ from .serializers import (
     RegisterSerializer,
     UserSerializer,
 )
+from .tokens import RefreshToken
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,7 @@ class RegisterView(generics.CreateAPIView):
 
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterRateThrottle]
 
     @transaction.atomic
     def create(self, request: Request, *args, **kwargs) -> Response:
@@ -58,6 +62,7 @@ class LoginView(generics.GenericAPIView):
 
     serializer_class = LoginSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         serializer = self.get_serializer(data=request.data)
@@ -96,7 +101,7 @@ class LoginView(generics.GenericAPIView):
         )
 
 
-class ProfileView(generics.RetrieveUpdateAPIView):
+class ProfileView(ReplicaReadMixin, generics.RetrieveUpdateAPIView):
     """Retrieve or update the authenticated user's profile."""
 
     serializer_class = UserSerializer
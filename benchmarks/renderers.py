@@ -0,0 +1,81 @@
+"""
+Render/parse cost of the stock JSON classes against orjson and MessagePack.
+
+Uses a list page shaped like ``GET /api/items/`` (``--rows`` items, default
+100), so no database is needed:
+
+    python benchmarks/renderers.py --rows 100 --repeat 200
+"""
+
+import argparse
+import io
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.core.parsers import MessagePackParser, ORJSONParser  # noqa: E402
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer  # noqa: E402
+
+
+def build_page(rows: int) -> dict:
+    return {
+        "count": rows * 10,
+        "next": "http://testserver/api/items/?page=2",
+        "previous": None,
+        "results": [
+            {
+                "id": i,
+                "name": f"Item {i}",
+                "description": "Benchmark item with a moderately long description — ünïcode.",
+                "category": "books",
+                "status": "active",
+                "price": f"{i % 1000}.99",
+                "owner": "bench@example.com",
+                "created_at": "2024-01-01T12:00:00.123456Z",
+                "updated_at": "2024-01-01T12:00:00.123456Z",
+            }
+            for i in range(1, rows + 1)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    page = build_page(args.rows)
+    assert ORJSONRenderer().render(page) == JSONRenderer().render(page)
+
+    pairs = [
+        ("json (stdlib)", JSONRenderer(), JSONParser()),
+        ("orjson", ORJSONRenderer(), ORJSONParser()),
+        ("msgpack", MessagePackRenderer(), MessagePackParser()),
+    ]
+    print(f"{'format':<14} {'render µs':>10} {'parse µs':>10} {'bytes':>8}")
+    for label, renderer, body_parser in pairs:
+        body = renderer.render(page)
+        render = min(timeit.repeat(lambda: renderer.render(page), number=args.repeat, repeat=5))
+        parse = min(
+            timeit.repeat(lambda: body_parser.parse(io.BytesIO(body)), number=args.repeat, repeat=5)
+        )
+        print(
+            f"{label:<14} {render / args.repeat * 1e6:10.1f} "
+            f"{parse / args.repeat * 1e6:10.1f} {len(body):8d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
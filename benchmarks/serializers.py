@@ -0,0 +1,79 @@
+"""
+Per-row cost of ``ItemSerializer`` against the ``RowSerializer`` read path.
+
+Rows are built in memory, so no database is needed:
+
+    python benchmarks/serializers.py --rows 1000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from apps.core.serializers import RowSerializer  # noqa: E402
+from apps.items.models import Item  # noqa: E402
+from apps.items.serializers import ItemSerializer  # noqa: E402
+from apps.users.models import User  # noqa: E402
+
+
+def build_rows(count: int) -> tuple[list[Item], list[dict]]:
+    owner = User(pk=1, email="bench@example.com")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    instances = [
+        Item(
+            pk=i,
+            name=f"Item {i}",
+            description="Benchmark item",
+            category="books",
+            status="active",
+            price=Decimal(i % 1000) + Decimal("0.99"),
+            owner=owner,
+            created_at=start + timedelta(seconds=i),
+            updated_at=start + timedelta(seconds=i),
+        )
+        for i in range(1, count + 1)
+    ]
+    fields = [name for name in ItemSerializer.Meta.fields if name != "owner"]
+    values = [{name: getattr(item, name) for name in fields} for item in instances]
+    return instances, values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fields", default="", help="Sparse fieldset for the row path.")
+    args = parser.parse_args()
+
+    instances, values = build_rows(args.rows)
+    constants = {"owner": "bench@example.com"}
+
+    def model_serializer():
+        return ItemSerializer(instances, many=True).data
+
+    def row_serializer():
+        serializer = RowSerializer.from_query_param(ItemSerializer, args.fields, constants=constants)
+        return [serializer.to_representation(dict(row)) for row in values]
+
+    if not args.fields:
+        expected = [dict(item) for item in model_serializer()]
+        assert row_serializer() == expected, "RowSerializer output differs from ItemSerializer"
+
+    for label, func in [("ItemSerializer", model_serializer), ("RowSerializer", row_serializer)]:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{label:<16} {best / args.rows * 1e6:8.2f} µs/row  ({best * 1e3:.1f} ms total)")
+
+
+if __name__ == "__main__":
+    main()
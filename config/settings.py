@@ -2,11 +2,14 @@
 Django settings for case study project.
 """
 
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
 from decouple import config
 
+from apps.core.dburl import parse_database_url
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # ─── Security ──────────────────────────────────────
@@ -74,29 +77,61 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 # ─── Database ──────────────────────────────────────
 
+# Connection and pool options go in the query string; see apps.core.dburl.
 DATABASE_URL = config('DATABASE_URL', default='')
 
 if DATABASE_URL:
-    import urllib.parse
-    _url = urllib.parse.urlparse(DATABASE_URL)
+    DATABASES = {'default': parse_database_url(DATABASE_URL)}
+else:
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.postgresql',
-            'NAME': _url.path[1:],
-            'USER': _url.username,
-            'PASSWORD': _url.password,
-            'HOST': _url.hostname,
-            'PORT': _url.port or 5432,
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
+    }
+
+# Read replicas (apps.core.db_router): comma-separated URLs, exposed as
+# replica1, replica2, ... Tests run them as mirrors of the default database.
+DATABASE_REPLICA_URLS = config(
+    'DATABASE_REPLICA_URLS',
+    default='',
+    cast=lambda v: [s.strip() for s in v.split(',') if s.strip()],
+)
+for _index, _url in enumerate(DATABASE_REPLICA_URLS, start=1):
+    DATABASES[f'replica{_index}'] = {**parse_database_url(_url), 'TEST': {'MIRROR': 'default'}}
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['apps.core.db_router.ReplicaRouter']
+# After a write, the user's reads stay on the primary this long, or until the
+# replica has replayed the write (PostgreSQL).
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=5, cast=float)
+
+# ─── Cache ─────────────────────────────────────────
+
+# Shared by every worker: a redis:// CACHE_URL (needs the `redis` package) or,
+# by default, a file-based cache on the local host.
+CACHE_URL = config('CACHE_URL', default='')
+
+if CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
         }
     }
 else:
-    DATABASES = {
+    CACHES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(Path(tempfile.gettempdir()) / 'case-study-api-cache'),
         }
     }
 
+# Item read responses (apps.items.cache): a per-process LRU in front of CACHES.
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TTL = config('RESPONSE_CACHE_TTL', default=300, cast=int)
+RESPONSE_CACHE_LOCAL_SIZE = config('RESPONSE_CACHE_LOCAL_SIZE', default=1000, cast=int)
+RESPONSE_CACHE_LOCAL_TTL = config('RESPONSE_CACHE_LOCAL_TTL', default=60, cast=int)
+
 # ─── Auth ──────────────────────────────────────────
 
 AUTH_USER_MODEL = 'users.User'
@@ -108,6 +143,11 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# Per-process cache of decoded JWTs and user rows (apps.users.authentication).
+# The TTL bounds how long other workers serve a user saved elsewhere.
+AUTH_CACHE_MAX_SIZE = config('AUTH_CACHE_MAX_SIZE', default=10000, cast=int)
+AUTH_CACHE_TTL = config('AUTH_CACHE_TTL', default=60, cast=int)
+
 # ─── Internationalization ──────────────────────────
 
 LANGUAGE_CODE = 'en-us'
@@ -125,7 +165,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -135,12 +175,44 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.ORJSONRenderer',
+        'apps.core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'apps.core.parsers.ORJSONParser',
+        'apps.core.parsers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'TEST_REQUEST_RENDERER_CLASSES': [
+        'rest_framework.renderers.MultiPartRenderer',
+        'apps.core.renderers.ORJSONRenderer',
+        'apps.core.renderers.MessagePackRenderer',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'apps.core.throttling.ReadRateThrottle',
+        'apps.core.throttling.WriteRateThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'reads': config('THROTTLE_RATE_READS', default='600/min'),
+        'writes': config('THROTTLE_RATE_WRITES', default='120/min'),
+        'login': config('THROTTLE_RATE_LOGIN', default='10/min'),
+        'register': config('THROTTLE_RATE_REGISTER', default='5/min'),
+    },
     'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.StandardPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'EXCEPTION_HANDLER': 'apps.core.exceptions.custom_exception_handler',
 }
 
+# Token buckets shared by every worker on the host (apps.core.throttling).
+THROTTLE_STORE_PATH = config(
+    'THROTTLE_STORE_PATH', default=str(Path(tempfile.gettempdir()) / 'case-study-api-throttle'),
+)
+THROTTLE_STORE_SLOTS = config('THROTTLE_STORE_SLOTS', default=65536, cast=int)
+
 # ─── JWT ───────────────────────────────────────────
 
 SIMPLE_JWT = {
@@ -149,8 +221,16 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_REFRESH_SERIALIZER': 'apps.users.serializers.TokenRefreshSerializer',
 }
 
+# Revoked refresh tokens (apps.users.blacklist): checked in memory, written in
+# batches, synced between workers every SYNC_INTERVAL seconds.
+TOKEN_BLACKLIST_CAPACITY = config('TOKEN_BLACKLIST_CAPACITY', default=100000, cast=int)
+TOKEN_BLACKLIST_BATCH_SIZE = config('TOKEN_BLACKLIST_BATCH_SIZE', default=50, cast=int)
+TOKEN_BLACKLIST_SYNC_INTERVAL = config('TOKEN_BLACKLIST_SYNC_INTERVAL', default=5, cast=float)
+TOKEN_BLACKLIST_PRUNE_INTERVAL = config('TOKEN_BLACKLIST_PRUNE_INTERVAL', default=3600, cast=float)
+
 # ─── Spectacular (Swagger) ────────────────────────
 
 SPECTACULAR_SETTINGS = {
@@ -161,6 +241,14 @@ SPECTACULAR_SETTINGS = {
 
 # ─── Logging ───────────────────────────────────────
 
+# Records are queued and written by a background thread (apps.core.log), as
+# one JSON object per line unless LOG_FORMAT=text.
+LOG_FORMAT = config('LOG_FORMAT', default='json')
+LOG_LEVEL = config('LOG_LEVEL', default='INFO')
+# Share of successful requests logged by RequestLoggingMiddleware; errors
+# are always logged.
+REQUEST_LOG_SAMPLE_RATE = config('REQUEST_LOG_SAMPLE_RATE', default=1.0, cast=float)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -169,11 +257,15 @@ LOGGING = {
             'format': '{levelname} {asctime} {name} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'apps.core.log.JSONFormatter',
+        },
     },
     'handlers': {
         'console': {
-            'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
+            'class': 'apps.core.log.QueueingHandler',
+            'formatter': 'json' if LOG_FORMAT == 'json' else 'verbose',
+            'stream': 'ext://sys.stderr',
         },
     },
     'root': {
@@ -183,7 +275,7 @@ LOGGING = {
     'loggers': {
         'apps': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': LOG_LEVEL,
             'propagate': False,
         },
     },
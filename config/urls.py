@@ -18,11 +18,15 @@ from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.core.views import DatabaseStatsView
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/users/', include('apps.users.urls')),
     path('api/items/', include('apps.items.urls')),
+    path('api/async/items/', include('apps.items.async_urls')),
+    path('api/internal/database/', DatabaseStatsView.as_view(), name='database-stats'),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
 ]
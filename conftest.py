@@ -1,10 +1,28 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.core.throttling import buckets
+from apps.items.cache import item_responses
+from apps.users import authentication
+from apps.users.blacklist import blacklist
 from apps.users.models import User
 
 
+@pytest.fixture(autouse=True)
+def clear_process_state():
+    # Test databases reuse primary keys and roll back revocations, and throttle
+    # buckets and cached responses outlive the process; none of that state may
+    # leak across tests.
+    authentication.token_cache.clear()
+    authentication.user_cache.clear()
+    blacklist.reset()
+    buckets.clear()
+    cache.clear()
+    item_responses.reset()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()